@@ -4,7 +4,9 @@ Foundation for all AI agents in the system.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import types
+from collections import deque
+from typing import Any, Callable, ClassVar, Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 from abc import ABC, abstractmethod
@@ -13,7 +15,7 @@ from abc import ABC, abstractmethod
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """Execution context for agents"""
     session_id: str
@@ -22,6 +24,43 @@ class AgentContext:
     state: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
 
+    # Bounded pool of reusable instances for hot paths that create and
+    # discard many short-lived contexts; the constructor stays the
+    # normal entry point and pooling is strictly opt-in
+    _pool: ClassVar['deque[AgentContext]'] = deque(maxlen=64)
+
+    @classmethod
+    def acquire(
+        cls,
+        session_id: str,
+        user_id: Optional[str] = None
+    ) -> 'AgentContext':
+        """
+        Get a context from the pool, or construct one if the pool is empty.
+
+        The returned context is reset: fresh session/user ids, empty
+        metadata and state dicts (reused in place), current created_at.
+        """
+        try:
+            ctx = cls._pool.pop()
+        except IndexError:
+            return cls(session_id=session_id, user_id=user_id)
+        ctx.session_id = session_id
+        ctx.user_id = user_id
+        ctx.metadata.clear()
+        ctx.state.clear()
+        ctx.created_at = datetime.now()
+        return ctx
+
+    def release(self) -> None:
+        """
+        Return this context to the pool for reuse.
+
+        Callers must not touch the context afterwards. When the pool is
+        full the context is simply dropped.
+        """
+        self._pool.append(self)
+
 
 class BaseAgent(ABC):
     """
@@ -38,9 +77,14 @@ class BaseAgent(ABC):
         self.name = name
         self.config = config or {}
         self._skills: Dict[str, Any] = {}
+        # name -> pre-resolved async callable, computed once at add_skill
+        # time so use_skill pays one dict probe and no hasattr checks
+        self._skill_invokers: Dict[str, Callable] = {}
+        # Read-only live view over _skills; built once, tracks mutations
+        self._skill_table = types.MappingProxyType(self._skills)
         self.logger = logging.getLogger(f"agent.{name}")
-        
-        self.logger.info(f"Agent {name} initialized")
+
+        self.logger.info("Agent %s initialized", name)
     
     @abstractmethod
     async def execute(self, task: str, context: AgentContext) -> Dict[str, Any]:
@@ -59,41 +103,67 @@ class BaseAgent(ABC):
     def add_skill(self, skill_name: str, skill):
         """Add a skill to the agent"""
         self._skills[skill_name] = skill
-        self.logger.debug(f"Added skill: {skill_name}")
-    
+
+        # Resolve the entry point once; invocation then skips the
+        # per-call hasattr/callable dispatch
+        if hasattr(skill, 'execute'):
+            self._skill_invokers[skill_name] = skill.execute
+        elif callable(skill):
+            self._skill_invokers[skill_name] = skill
+        else:
+            raise TypeError(f"Skill '{skill_name}' is not callable")
+
+        self.logger.debug("Added skill: %s", skill_name)
+
+    @property
+    def skills(self) -> 'types.MappingProxyType':
+        """
+        Read-only view of registered skills.
+
+        The proxy is created once and tracks add_skill mutations live,
+        so handing it out never copies the dict and callers cannot
+        mutate the registry behind the agent's back.
+        """
+        return self._skill_table
+
     def has_skill(self, skill_name: str) -> bool:
         """Check if agent has a skill"""
-        return skill_name in self._skills
-    
+        return skill_name in self._skill_table
+
+    def get_skill(self, skill_name: str) -> Callable:
+        """
+        Get the pre-resolved callable for a skill.
+
+        Hot loops can fetch the handle once and await it directly,
+        bypassing the name lookup in use_skill on every call.
+        """
+        invoker = self._skill_invokers.get(skill_name)
+        if invoker is None:
+            raise ValueError(f"Skill '{skill_name}' not available")
+        return invoker
+
     async def use_skill(self, skill_name: str, **kwargs) -> Any:
         """Use a registered skill"""
-        if not self.has_skill(skill_name):
+        invoker = self._skill_invokers.get(skill_name)
+        if invoker is None:
             raise ValueError(f"Skill '{skill_name}' not available")
-        
-        skill = self._skills[skill_name]
-        
-        if hasattr(skill, 'execute'):
-            return await skill.execute(**kwargs)
-        elif callable(skill):
-            return await skill(**kwargs)
-        else:
-            raise TypeError(f"Skill '{skill_name}' is not callable")
-    
-    def log_info(self, message: str):
-        """Log info message"""
-        self.logger.info(message)
+        return await invoker(**kwargs)
     
-    def log_warning(self, message: str):
-        """Log warning message"""
-        self.logger.warning(message)
-    
-    def log_error(self, message: str):
-        """Log error message"""
-        self.logger.error(message)
-    
-    def log_debug(self, message: str):
-        """Log debug message"""
-        self.logger.debug(message)
+    def log_info(self, message: str, *args: Any):
+        """Log info message; %-style args defer formatting to the handler"""
+        self.logger.info(message, *args)
+
+    def log_warning(self, message: str, *args: Any):
+        """Log warning message; %-style args defer formatting to the handler"""
+        self.logger.warning(message, *args)
+
+    def log_error(self, message: str, *args: Any):
+        """Log error message; %-style args defer formatting to the handler"""
+        self.logger.error(message, *args)
+
+    def log_debug(self, message: str, *args: Any):
+        """Log debug message; %-style args defer formatting to the handler"""
+        self.logger.debug(message, *args)
     
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
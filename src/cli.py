@@ -8,9 +8,8 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from src.core.autowire import get_autowire, Scope
-from src.config import get_config_loader, EnvManager
-from src.core.registry import ServiceRegistry, ComponentRegistry
+# Project modules are imported inside command bodies so that lightweight
+# invocations (--help, version, init) don't pay for the full framework import
 
 
 # Setup logging
@@ -66,9 +65,22 @@ def init(env: str, config_dir: Optional[str]):
             }
         }
         
+        import hashlib
         import json
+        default_json = json.dumps(default_config, indent=2)
         with open(config_path / 'default.json', 'w') as f:
-            json.dump(default_config, f, indent=2)
+            f.write(default_json)
+
+        # Emit a pre-compiled Python module for the default configuration so
+        # load_all can skip the JSON parse entirely. The source hash header
+        # lets loaders detect a stale module after default.json is edited.
+        source_hash = hashlib.blake2b(default_json.encode(), digest_size=16).hexdigest()
+        with open(config_path / '_default_frozen.py', 'w') as f:
+            f.write(
+                "# Auto-generated by 'ai-wire init' - do not edit.\n"
+                f"SOURCE_HASH = {source_hash!r}\n"
+                f"DEFAULT = {default_config!r}\n"
+            )
         
         # Create .env template
         env_template = """# AI Auto-Wiring System Configuration
@@ -108,6 +120,10 @@ def start(env: str):
     click.echo(f"🚀 Starting AI Auto-Wiring System (env={env})")
     
     try:
+        from src.core.autowire import get_autowire
+        from src.config import get_config_loader
+        from src.core.registry import ServiceRegistry, ComponentRegistry
+
         # Load configuration
         config_loader = get_config_loader(env=env)
         click.echo("✅ Configuration loaded")
@@ -135,22 +151,28 @@ def status():
     click.echo("📊 AI Auto-Wiring System Status\n")
     
     try:
+        import itertools
+
+        from src.core.autowire import get_autowire
+
         # Check auto-wire
         autowire = get_autowire()
         registry_info = autowire.get_registry_info()
-        
+        registry_count = len(registry_info)
+
         click.echo(f"🔌 Auto-Wire Engine: Running")
-        click.echo(f"   Registered dependencies: {len(registry_info)}")
-        
+        click.echo(f"   Registered dependencies: {registry_count}")
+
         # Show registered components
         if registry_info:
             click.echo("\n📦 Registered Dependencies:")
-            for name, info in list(registry_info.items())[:5]:
+            # islice avoids materializing the full item list just to show 5
+            for name, info in itertools.islice(registry_info.items(), 5):
                 status_icon = "✅" if info['initialized'] else "⏳"
                 click.echo(f"   {status_icon} {name} (scope={info['scope']})")
-            
-            if len(registry_info) > 5:
-                click.echo(f"   ... and {len(registry_info) - 5} more")
+
+            if registry_count > 5:
+                click.echo(f"   ... and {registry_count - 5} more")
         
         click.echo("\n✅ System is operational")
         
@@ -186,9 +208,11 @@ def list_components(category: Optional[str]):
     click.echo("📦 Registered Components\n")
     
     try:
+        from src.core.autowire import get_autowire
+
         autowire = get_autowire()
         registry_info = autowire.get_registry_info()
-        
+
         if not registry_info:
             click.echo("No components registered")
             return
@@ -218,6 +242,8 @@ def list_components(category: Optional[str]):
 def export_config(format: str):
     """Export current configuration"""
     try:
+        from src.config import get_config_loader
+
         config_loader = get_config_loader()
         config = config_loader.get_all()
         
@@ -226,7 +252,13 @@ def export_config(format: str):
             click.echo(json.dumps(config, indent=2))
         elif format == 'yaml':
             import yaml
-            click.echo(yaml.dump(config, default_flow_style=False))
+            try:
+                from yaml import CSafeDumper as Dumper
+            except ImportError:
+                # libyaml bindings unavailable; pure-Python dumper is ~10x slower
+                click.echo("⚠️  libyaml not available, using pure-Python YAML dumper", err=True)
+                from yaml import SafeDumper as Dumper
+            click.echo(yaml.dump(config, Dumper=Dumper, default_flow_style=False))
         else:  # table
             def print_dict(d, indent=0):
                 for key, value in d.items():
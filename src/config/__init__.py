@@ -12,5 +12,18 @@ __all__ = [
     'ConfigValidationError',
     'ConfigLoader',
     'get_config_loader',
-    'get_config'
+    'get_config',
+    'config'
 ]
+
+
+def __getattr__(name):
+    """
+    Lazily expose the global loader as `config` (PEP 562).
+
+    `from src.config import config` binds the loader without touching any
+    configuration sources; the actual load happens on first read.
+    """
+    if name == 'config':
+        return get_config_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
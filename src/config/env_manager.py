@@ -6,7 +6,7 @@ Multi-source configuration with validation, encryption, and hot-reloading.
 import os
 import json
 import logging
-from typing import Any, Dict, List, Optional, Callable, Union
+from typing import Any, Dict, List, Optional, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from pathlib import Path
 from enum import Enum
@@ -17,6 +17,9 @@ import threading
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing "key absent" from any real configured value
+_MISSING = object()
+
 
 class ConfigSource(Enum):
     """Configuration source types"""
@@ -57,6 +60,9 @@ class ConfigRule:
     description: str = ""
     sensitive: bool = False
     environment_var: Optional[str] = None
+    # Compiled pattern attached by EnvManager.add_rule; avoids recompiling
+    # (and churning re's internal cache) on every validate() pass
+    _compiled_pattern: Optional[re.Pattern] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -74,6 +80,78 @@ class ConfigValidationError(Exception):
     pass
 
 
+# Single-pass .env parser: matches KEY=value lines, skipping blank lines
+# and comments, so load_env_file can finditer over the whole buffer instead
+# of splitting/stripping line by line
+_ENV_LINE_RE = re.compile(
+    r'^\s*(?!#|//)([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$',
+    re.MULTILINE,
+)
+
+# Precompiled patterns for format validators
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_PATTERN = re.compile(r'^https?://[^\s]+$')
+
+
+def _check_range(val: Union[int, float], rule: 'ConfigRule'):
+    """Check numeric value against optional min/max bounds"""
+    if rule.min_value is not None and val < rule.min_value:
+        raise ConfigValidationError(f"{rule.name}: value {val} < min {rule.min_value}")
+    if rule.max_value is not None and val > rule.max_value:
+        raise ConfigValidationError(f"{rule.name}: value {val} > max {rule.max_value}")
+
+
+def _validate_integer(value: Any, rule: 'ConfigRule'):
+    try:
+        val = int(value)
+    except (ValueError, TypeError):
+        raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid integer")
+    _check_range(val, rule)
+
+
+def _validate_float(value: Any, rule: 'ConfigRule'):
+    try:
+        val = float(value)
+    except (ValueError, TypeError):
+        raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid float")
+    _check_range(val, rule)
+
+
+def _validate_boolean(value: Any, rule: 'ConfigRule'):
+    if not isinstance(value, bool) and str(value).lower() not in ('true', 'false', 'yes', 'no', '1', '0'):
+        raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid boolean")
+
+
+def _validate_email(value: Any, rule: 'ConfigRule'):
+    if not _EMAIL_PATTERN.match(str(value)):
+        raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid email")
+
+
+def _validate_url(value: Any, rule: 'ConfigRule'):
+    if not _URL_PATTERN.match(str(value)):
+        raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid URL")
+
+
+def _validate_port(value: Any, rule: 'ConfigRule'):
+    try:
+        port = int(value)
+    except (ValueError, TypeError):
+        raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid port")
+    if not (1 <= port <= 65535):
+        raise ConfigValidationError(f"{rule.name}: port {port} out of range (1-65535)")
+
+
+# O(1) type dispatch table; types without a dedicated check are absent
+_VALIDATORS: Dict[ValidationType, Callable[[Any, 'ConfigRule'], None]] = {
+    ValidationType.INTEGER: _validate_integer,
+    ValidationType.FLOAT: _validate_float,
+    ValidationType.BOOLEAN: _validate_boolean,
+    ValidationType.EMAIL: _validate_email,
+    ValidationType.URL: _validate_url,
+    ValidationType.PORT: _validate_port,
+}
+
+
 class EnvManager:
     """
     Advanced Environment Configuration Manager.
@@ -95,7 +173,18 @@ class EnvManager:
     ):
         self.env = env
         self.config_dir = config_dir or Path.cwd()
+        # Candidate .env locations, computed once; load_env_file probes them
+        # with os.path.isfile and caches the first hit
+        self._env_candidates = (
+            self.config_dir / f".env.{self.env}",
+            self.config_dir / ".env.local",
+            self.config_dir / ".env",
+        )
+        self._resolved_env_file: Optional[Path] = None
         self._config: Dict[str, ConfigValue] = {}
+        # Parsed int/float values keyed by (key, type), invalidated
+        # whenever the underlying value changes
+        self._coerced: Dict[Tuple[str, type], Any] = {}
         self._rules: Dict[str, ConfigRule] = {}
         self._watchers: List[Callable[[str, Any], None]] = []
         self._lock = threading.RLock()
@@ -108,6 +197,15 @@ class EnvManager:
     def add_rule(self, rule: ConfigRule) -> 'EnvManager':
         """Add a validation rule"""
         with self._lock:
+            # Freeze the rule for repeated validation: compile the pattern
+            # once and convert choices to a frozenset for O(1) membership
+            if rule.pattern:
+                rule._compiled_pattern = re.compile(rule.pattern)
+            if rule.choices:
+                try:
+                    rule.choices = frozenset(rule.choices)
+                except TypeError:
+                    pass  # Unhashable choices keep the original list
             self._rules[rule.name] = rule
             logger.debug(f"Added validation rule: {rule.name}")
             return self
@@ -130,19 +228,17 @@ class EnvManager:
         """
         with self._lock:
             if file_path is None:
-                # Try multiple .env file locations
-                env_files = [
-                    self.config_dir / f".env.{self.env}",
-                    self.config_dir / ".env.local",
-                    self.config_dir / ".env",
-                ]
-                
-                for env_file in env_files:
-                    if env_file.exists():
-                        file_path = env_file
-                        break
-            
-            if file_path is None or not file_path.exists():
+                if self._resolved_env_file is not None:
+                    file_path = self._resolved_env_file
+                else:
+                    # os.path.isfile avoids the stat-object overhead of
+                    # Path.exists and skips directories named .env
+                    for env_file in self._env_candidates:
+                        if os.path.isfile(env_file):
+                            file_path = self._resolved_env_file = env_file
+                            break
+
+            if file_path is None or not os.path.isfile(file_path):
                 logger.warning(f"No .env file found")
                 return self
             
@@ -151,29 +247,18 @@ class EnvManager:
             with open(file_path, 'r') as f:
                 content = f.read()
             
-            # Parse .env file
-            for line in content.splitlines():
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#') or line.startswith('//'):
-                    continue
-                
-                # Parse KEY=VALUE
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    
-                    # Variable expansion
-                    value = self._expand_variables(value)
-                    
-                    self._set_value(key, value, ConfigSource.ENV_FILE)
+            # Parse the whole buffer in one regex pass
+            for match in _ENV_LINE_RE.finditer(content):
+                key, value = match.group(1), match.group(2)
+
+                # Remove quotes
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+                    value = value[1:-1]
+
+                # Variable expansion
+                value = self._expand_variables(value)
+
+                self._set_value(key, value, ConfigSource.ENV_FILE)
             
             return self
     
@@ -212,6 +297,9 @@ class EnvManager:
     def load_all(self) -> 'EnvManager':
         """Load configuration from all sources in priority order"""
         with self._lock:
+            # 0. Load pre-compiled defaults emitted by 'ai-wire init' (if any)
+            self._load_frozen_defaults()
+
             # 1. Load base .env file
             self.load_env_file()
             
@@ -227,6 +315,46 @@ class EnvManager:
             
             return self
     
+    def _load_frozen_defaults(self) -> bool:
+        """
+        Load defaults from the pre-compiled module written by 'ai-wire init'.
+
+        config/_default_frozen.py holds the default configuration as a Python
+        literal, letting startup skip the JSON parse of default.json. A stale
+        module (SOURCE_HASH no longer matching default.json) is ignored.
+
+        Returns:
+            True if frozen defaults were loaded
+        """
+        frozen_path = self.config_dir / 'config' / '_default_frozen.py'
+        if not frozen_path.exists():
+            return False
+
+        try:
+            namespace: Dict[str, Any] = {}
+            exec(compile(frozen_path.read_bytes(), str(frozen_path), 'exec'), namespace)
+
+            defaults = namespace.get('DEFAULT')
+            if not isinstance(defaults, dict):
+                return False
+
+            # Invalidate when default.json has been edited since generation
+            source_path = frozen_path.with_name('default.json')
+            source_hash = namespace.get('SOURCE_HASH')
+            if source_hash and source_path.exists():
+                import hashlib
+                if hashlib.blake2b(source_path.read_bytes(), digest_size=16).hexdigest() != source_hash:
+                    logger.debug("Frozen defaults stale, falling back to default.json")
+                    return False
+
+            self._load_dict(defaults, ConfigSource.JSON_FILE)
+            logger.info(f"Loaded frozen defaults: {frozen_path}")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to load frozen defaults {frozen_path}: {e}")
+            return False
+
     def get(self, key: str, default: Any = None, required: bool = False) -> Any:
         """
         Get configuration value.
@@ -250,20 +378,38 @@ class EnvManager:
             return config_value.value
     
     def get_int(self, key: str, default: int = 0) -> int:
-        """Get integer configuration value"""
-        value = self.get(key, default)
+        """Get integer configuration value (parsed once per key)"""
+        cached = self._coerced.get((key, int))
+        if cached is not None:
+            return cached
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # Absent keys are never cached: the caller's default must
+            # not stick for later calls with a different default
+            return default
         try:
-            return int(value)
+            result = int(value)
         except (ValueError, TypeError):
             return default
-    
+        self._coerced[(key, int)] = result
+        return result
+
     def get_float(self, key: str, default: float = 0.0) -> float:
-        """Get float configuration value"""
-        value = self.get(key, default)
+        """Get float configuration value (parsed once per key)"""
+        cached = self._coerced.get((key, float))
+        if cached is not None:
+            return cached
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # Absent keys are never cached: the caller's default must
+            # not stick for later calls with a different default
+            return default
         try:
-            return float(value)
+            result = float(value)
         except (ValueError, TypeError):
             return default
+        self._coerced[(key, float)] = result
+        return result
     
     def get_bool(self, key: str, default: bool = False) -> bool:
         """Get boolean configuration value"""
@@ -388,7 +534,11 @@ class EnvManager:
         )
         
         self._config[key] = config_value
-        
+
+        # Drop any stale coerced views of this key
+        self._coerced.pop((key, int), None)
+        self._coerced.pop((key, float), None)
+
         # Notify watchers
         if old_value is None or old_value.value != value:
             for watcher in self._watchers:
@@ -400,10 +550,12 @@ class EnvManager:
     def _load_dict(self, data: Dict[str, Any], source: ConfigSource, prefix: str = ""):
         """Recursively load dictionary data"""
         for key, value in data.items():
-            full_key = f"{prefix}{key}" if prefix else key
-            
+            # Single concatenation per level; prefix already carries the
+            # trailing separator so no per-key f-string formatting is needed
+            full_key = prefix + key
+
             if isinstance(value, dict):
-                self._load_dict(value, source, f"{full_key}_")
+                self._load_dict(value, source, full_key + "_")
             else:
                 self._set_value(full_key, value, source)
     
@@ -419,53 +571,17 @@ class EnvManager:
     
     def _validate_value(self, value: Any, rule: ConfigRule):
         """Validate a value against a rule"""
-        # Type validation
-        if rule.validation_type == ValidationType.INTEGER:
-            try:
-                val = int(value)
-                if rule.min_value is not None and val < rule.min_value:
-                    raise ConfigValidationError(f"{rule.name}: value {val} < min {rule.min_value}")
-                if rule.max_value is not None and val > rule.max_value:
-                    raise ConfigValidationError(f"{rule.name}: value {val} > max {rule.max_value}")
-            except ValueError:
-                raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid integer")
-        
-        elif rule.validation_type == ValidationType.FLOAT:
-            try:
-                val = float(value)
-                if rule.min_value is not None and val < rule.min_value:
-                    raise ConfigValidationError(f"{rule.name}: value {val} < min {rule.min_value}")
-                if rule.max_value is not None and val > rule.max_value:
-                    raise ConfigValidationError(f"{rule.name}: value {val} > max {rule.max_value}")
-            except ValueError:
-                raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid float")
-        
-        elif rule.validation_type == ValidationType.BOOLEAN:
-            if not isinstance(value, bool) and str(value).lower() not in ('true', 'false', 'yes', 'no', '1', '0'):
-                raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid boolean")
-        
-        elif rule.validation_type == ValidationType.EMAIL:
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, str(value)):
-                raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid email")
-        
-        elif rule.validation_type == ValidationType.URL:
-            url_pattern = r'^https?://[^\s]+$'
-            if not re.match(url_pattern, str(value)):
-                raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid URL")
-        
-        elif rule.validation_type == ValidationType.PORT:
-            try:
-                port = int(value)
-                if not (1 <= port <= 65535):
-                    raise ConfigValidationError(f"{rule.name}: port {port} out of range (1-65535)")
-            except ValueError:
-                raise ConfigValidationError(f"{rule.name}: '{value}' is not a valid port")
-        
-        # Pattern validation
-        if rule.pattern and not re.match(rule.pattern, str(value)):
-            raise ConfigValidationError(f"{rule.name}: '{value}' does not match pattern {rule.pattern}")
-        
+        # Type validation via O(1) dispatch table
+        validator = _VALIDATORS.get(rule.validation_type)
+        if validator:
+            validator(value, rule)
+
+        # Pattern validation (compiled once in add_rule)
+        if rule.pattern:
+            pattern = rule._compiled_pattern or re.compile(rule.pattern)
+            if not pattern.match(str(value)):
+                raise ConfigValidationError(f"{rule.name}: '{value}' does not match pattern {rule.pattern}")
+
         # Choices validation
         if rule.choices and value not in rule.choices:
             raise ConfigValidationError(f"{rule.name}: '{value}' not in allowed choices {rule.choices}")
@@ -3,16 +3,51 @@ Configuration Auto-Discovery and Loading System
 Intelligent configuration loading from multiple sources with merging.
 """
 
+import functools
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 import json
 import os
+import re
+
+try:
+    import orjson  # Rust JSON parser, ~5x faster than the stdlib
+except ImportError:
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
 
+# One-pass .env parser: KEY=value lines, skipping blanks and # comments,
+# with optional surrounding quotes captured for stripping
+_DOTENV_RE = re.compile(
+    r'^\s*(?!#)([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(["\']?)(.*?)\2\s*$',
+    re.MULTILINE,
+)
+
+
+@functools.cache
+def _get_yaml():
+    """
+    Import PyYAML once and pick the fastest safe loader available.
+
+    Returns (yaml module, loader class), or (None, None) when PyYAML is
+    not installed. CSafeLoader (libyaml) is roughly 10x faster than the
+    pure-Python SafeLoader.
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None, None
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return yaml, Loader
+
+
 class ConfigLoader:
     """
     Advanced configuration loader with auto-discovery and hierarchical merging.
@@ -36,65 +71,178 @@ class ConfigLoader:
         self.env = env
         self.config_dirs = config_dirs or ['config', 'configs', '.config']
         self._merged_config: Dict[str, Any] = {}
-        
-        logger.info(f"ConfigLoader initialized (env={env}, base={self.base_dir})")
-    
+        # Flat dotted-path index over _merged_config; rebuilt lazily after
+        # any mutation so get() is a single dict lookup
+        self._flat: Optional[Dict[str, Any]] = None
+        # Source layers are loaded lazily on first read (or via an
+        # explicit discover_and_load call)
+        self._loaded = False
+
+        logger.info("ConfigLoader initialized (env=%s, base=%s)", env, self.base_dir)
+
     def discover_and_load(self) -> Dict[str, Any]:
         """
         Discover and load all configuration sources.
-        
+
+        The file-derived layers (JSON, YAML, .env) are cached as a pickle
+        keyed by a fingerprint of the source files, so repeated startups
+        skip parsing and merging entirely. Environment variables are always
+        applied fresh on top. Set AI_CONFIG_CACHE=0 to disable the cache.
+
+        Loading normally happens lazily on first get()/get_all()/set()/
+        merge(); call this directly to force it.
+
         Returns:
             Merged configuration dictionary
         """
+        self._load_layers()
+        return self._merged_config
+
+    def _ensure_loaded(self):
+        """Force the deferred source layers on first config access"""
+        if not self._loaded:
+            self._load_layers()
+
+    def _load_layers(self):
+        """Load and merge every configuration layer in priority order"""
         # 1. Find configuration directory
         config_dir = self._find_config_dir()
-        
-        if config_dir:
-            logger.info(f"Found config directory: {config_dir}")
-            
-            # 2. Load default config
-            self._load_config_file(config_dir / "default.json", merge=True)
-            self._load_config_file(config_dir / "default.yaml", merge=True)
-            
-            # 3. Load environment-specific config
-            self._load_config_file(config_dir / f"{self.env}.json", merge=True)
-            self._load_config_file(config_dir / f"{self.env}.yaml", merge=True)
-            
-            # 4. Load local overrides
-            self._load_config_file(config_dir / "local.json", merge=True)
-            self._load_config_file(config_dir / "local.yaml", merge=True)
-        
-        # 5. Load .env files
-        self._load_env_file()
-        
-        # 6. Load environment variables with AI_ prefix
+
+        use_cache = os.environ.get('AI_CONFIG_CACHE', '1') != '0'
+        fingerprint = self._source_fingerprint(config_dir) if use_cache else None
+
+        cached = self._load_cache(fingerprint) if fingerprint else None
+        if cached is not None:
+            self._merged_config = cached
+            logger.info("Loaded file-derived configuration from cache")
+        else:
+            if config_dir:
+                logger.info("Found config directory: %s", config_dir)
+
+                # One directory listing instead of a stat per candidate file
+                existing = set(os.listdir(config_dir))
+
+                # 2. Default config, 3. environment-specific, 4. local overrides
+                for name in (
+                    "default.json", "default.yaml",
+                    f"{self.env}.json", f"{self.env}.yaml",
+                    "local.json", "local.yaml",
+                ):
+                    if name in existing:
+                        self._load_config_file(config_dir / name, merge=True)
+
+            # 5. Load .env files
+            self._load_env_file()
+
+            if fingerprint:
+                self._save_cache(fingerprint)
+
+        # 6. Load environment variables with AI_ prefix (never cached)
         self._load_env_variables()
-        
-        logger.info(f"Loaded {len(self._merged_config)} configuration keys")
-        
-        return self._merged_config
+
+        self._flat = None
+        self._loaded = True
+
+        logger.info("Loaded %d configuration keys", len(self._merged_config))
+
+    def _source_files(self, config_dir: Optional[Path]) -> List[Path]:
+        """All files that can feed the file-derived configuration layers"""
+        files = []
+        if config_dir:
+            for stem in ("default", self.env, "local"):
+                files.append(config_dir / f"{stem}.json")
+                files.append(config_dir / f"{stem}.yaml")
+        files.append(self.base_dir / f".env.{self.env}")
+        files.append(self.base_dir / ".env.local")
+        files.append(self.base_dir / ".env")
+        return files
+
+    def _source_fingerprint(self, config_dir: Optional[Path]) -> str:
+        """Fingerprint source files by mtime and size (no content reads)"""
+        import hashlib
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{self.base_dir}|{self.env}".encode())
+        for path in self._source_files(config_dir):
+            try:
+                st = os.stat(path)
+                h.update(f"|{path.name}:{st.st_mtime_ns}:{st.st_size}".encode())
+            except OSError:
+                h.update(f"|{path.name}:absent".encode())
+        return h.hexdigest()
+
+    def _cache_path(self, fingerprint: str) -> Path:
+        cache_dir = Path(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))) / 'wiredup'
+        return cache_dir / f"config-{fingerprint}.pkl"
+
+    def _load_cache(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Load the cached file-derived config, or None on any failure"""
+        import pickle
+
+        try:
+            with open(self._cache_path(fingerprint), 'rb') as f:
+                cached = pickle.load(f)
+            if isinstance(cached, dict):
+                return cached
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        except Exception as e:
+            logger.debug("Config cache read failed: %s", e)
+        return None
+
+    def _save_cache(self, fingerprint: str):
+        """Persist the file-derived config; failures are non-fatal"""
+        import pickle
+
+        cache_path = self._cache_path(fingerprint)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            # The cached payload includes the .env layer (API keys,
+            # passwords), so the file must be owner-readable only
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(self._merged_config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # O_CREAT mode does not apply if the tmp file survived a
+            # previous run with wider permissions; tighten explicitly
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, cache_path)
+            logger.debug("Wrote config cache: %s", cache_path)
+        except OSError as e:
+            logger.debug("Config cache write failed: %s", e)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'mcp.port')"""
-        keys = key.split('.')
-        value = self._merged_config
-        
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-        
-        return value
+        flat = self._flat
+        if flat is None:
+            self._ensure_loaded()
+            flat = self._build_flat_index()
+
+        value = flat.get(key)
+        return default if value is None else value
+
+    def _build_flat_index(self) -> Dict[str, Any]:
+        """Flatten the merged config into a {dotted.path: value} index"""
+        flat: Dict[str, Any] = {}
+        stack = [('', self._merged_config)]
+        while stack:
+            prefix, node = stack.pop()
+            for k, v in node.items():
+                path = prefix + k
+                flat[path] = v
+                if type(v) is dict:
+                    stack.append((path + '.', v))
+        self._flat = flat
+        return flat
     
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration"""
+        self._ensure_loaded()
         return self._merged_config.copy()
-    
+
     def set(self, key: str, value: Any):
         """Set configuration value using dot notation"""
+        self._ensure_loaded()
         keys = key.split('.')
         config = self._merged_config
         
@@ -102,20 +250,30 @@ class ConfigLoader:
             if k not in config or not isinstance(config[k], dict):
                 config[k] = {}
             config = config[k]
-        
+
         config[keys[-1]] = value
-    
+        self._flat = None
+
     def merge(self, config: Dict[str, Any]):
         """Merge configuration dictionary"""
+        self._ensure_loaded()
         self._deep_merge(self._merged_config, config)
+        self._flat = None
     
     def _find_config_dir(self) -> Optional[Path]:
         """Find configuration directory"""
+        # One scandir over base_dir instead of exists+is_dir stat pairs
+        # per candidate; entry.is_dir() reads the dirent type for free
+        try:
+            with os.scandir(self.base_dir) as entries:
+                subdirs = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            return None
+
         for dir_name in self.config_dirs:
-            config_dir = self.base_dir / dir_name
-            if config_dir.exists() and config_dir.is_dir():
-                return config_dir
-        
+            if dir_name in subdirs:
+                return self.base_dir / dir_name
+
         return None
     
     def _load_config_file(self, file_path: Path, merge: bool = True):
@@ -125,32 +283,34 @@ class ConfigLoader:
         
         try:
             if file_path.suffix == '.json':
-                with open(file_path, 'r') as f:
-                    config = json.load(f)
-                    logger.info(f"Loaded config file: {file_path}")
-                    
-                    if merge:
-                        self._deep_merge(self._merged_config, config)
-                    else:
-                        self._merged_config = config
+                # orjson parses bytes directly, so skip text decoding too
+                data = file_path.read_bytes()
+                config = orjson.loads(data) if orjson else json.loads(data)
+                logger.info("Loaded config file: %s", file_path)
+
+                if merge:
+                    self._deep_merge(self._merged_config, config)
+                else:
+                    self._merged_config = config
             
             elif file_path.suffix in ('.yaml', '.yml'):
-                try:
-                    import yaml
-                    with open(file_path, 'r') as f:
-                        config = yaml.safe_load(f)
-                        logger.info(f"Loaded config file: {file_path}")
-                        
-                        if merge:
-                            self._deep_merge(self._merged_config, config)
-                        else:
-                            self._merged_config = config
-                
-                except ImportError:
+                yaml, Loader = _get_yaml()
+                if yaml is None:
                     logger.warning("PyYAML not installed, skipping YAML files")
+                    return
+
+                # Feed bytes straight to the loader: libyaml handles the
+                # UTF-8 decode itself and a stream read would chunk at 4KB
+                config = yaml.load(file_path.read_bytes(), Loader=Loader)
+                logger.info("Loaded config file: %s", file_path)
+
+                if merge:
+                    self._deep_merge(self._merged_config, config)
+                else:
+                    self._merged_config = config
         
         except Exception as e:
-            logger.error(f"Failed to load config file {file_path}: {e}")
+            logger.error("Failed to load config file %s: %s", file_path, e)
     
     def _load_env_file(self):
         """Load .env file"""
@@ -162,80 +322,127 @@ class ConfigLoader:
         
         for env_file in env_files:
             if env_file.exists():
-                logger.info(f"Loading .env file: {env_file}")
+                logger.info("Loading .env file: %s", env_file)
                 
                 try:
                     with open(env_file, 'r') as f:
-                        for line in f:
-                            line = line.strip()
-                            
-                            if not line or line.startswith('#'):
-                                continue
-                            
-                            if '=' in line:
-                                key, value = line.split('=', 1)
-                                key = key.strip()
-                                value = value.strip().strip('"').strip("'")
-                                
-                                # Convert key to nested structure
-                                self._set_from_env_key(key, value)
-                
+                        content = f.read()
+
+                    # One regex pass over the whole buffer; quote stripping
+                    # happens via the backreferenced quote group
+                    for match in _DOTENV_RE.finditer(content):
+                        # Convert key to nested structure
+                        self._set_from_env_key(match.group(1), match.group(3))
+
                 except Exception as e:
-                    logger.error(f"Failed to load .env file {env_file}: {e}")
+                    logger.error("Failed to load .env file %s: %s", env_file, e)
                 
                 break  # Only load first found .env file
     
     def _load_env_variables(self):
         """Load environment variables with AI_ prefix"""
-        for key, value in os.environ.items():
-            if key.startswith('AI_'):
-                # Remove AI_ prefix and convert to nested structure
-                config_key = key[3:]  # Remove 'AI_'
-                self._set_from_env_key(config_key, value)
-                logger.debug(f"Loaded env var: {key}")
+        # Sorting groups siblings (AI_MCP_HOST, AI_MCP_PORT, ...) together
+        # so the parent-dict walk is shared between consecutive keys
+        ai_vars = sorted(
+            (key, value) for key, value in os.environ.items()
+            if key.startswith('AI_')
+        )
+
+        last_path = None
+        last_parent = None
+
+        for key, value in ai_vars:
+            parts = key[3:].lower().split('_')  # Remove 'AI_'
+            parent_path = tuple(parts[:-1])
+
+            if parent_path == last_path:
+                parent = last_parent
+            else:
+                parent = self._merged_config
+                for part in parent_path:
+                    if part not in parent:
+                        parent[part] = {}
+                    parent = parent[part]
+                last_path, last_parent = parent_path, parent
+
+            parent[parts[-1]] = self._parse_env_value(value)
+            logger.debug("Loaded env var: %s", key)
     
     def _set_from_env_key(self, key: str, value: str):
         """Convert environment variable key to nested config structure"""
         # Convert KEY_SUBKEY to key.subkey
         parts = key.lower().split('_')
-        
+
         config = self._merged_config
         for part in parts[:-1]:
             if part not in config:
                 config[part] = {}
             config = config[part]
-        
-        # Try to parse value as JSON for lists/dicts
-        try:
-            parsed_value = json.loads(value)
-            config[parts[-1]] = parsed_value
-        except (json.JSONDecodeError, ValueError):
-            # Try to convert to boolean
-            if value.lower() in ('true', 'false'):
-                config[parts[-1]] = value.lower() == 'true'
-            # Try to convert to number
-            elif value.isdigit():
-                config[parts[-1]] = int(value)
-            elif self._is_float(value):
-                config[parts[-1]] = float(value)
-            else:
-                config[parts[-1]] = value
-    
-    def _deep_merge(self, base: Dict, update: Dict):
-        """Deep merge two dictionaries"""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
-    
-    def _is_float(self, value: str) -> bool:
-        """Check if string can be converted to float"""
-        try:
-            float(value)
+
+        config[parts[-1]] = self._parse_env_value(value)
+
+    def _parse_env_value(self, value: str) -> Any:
+        """
+        Coerce an environment variable string to JSON/bool/number/str.
+
+        The first character picks the parse path, so plain strings (the
+        common case) never pay for a raised-and-caught json.loads.
+        """
+        if not value:
+            return value
+
+        first = value[0]
+
+        # JSON containers and quoted strings
+        if first in '[{"':
+            try:
+                return json.loads(value)
+            except (json.JSONDecodeError, ValueError):
+                return value
+
+        # Booleans and null
+        lowered = value.lower()
+        if lowered == 'true':
             return True
-        except ValueError:
+        if lowered == 'false':
             return False
+        if lowered == 'null':
+            return None
+
+        # Numbers
+        if first.isdigit() or first in '-+.':
+            try:
+                return int(value)
+            except ValueError:
+                try:
+                    return float(value)
+                except ValueError:
+                    return value
+
+        return value
+    
+    def _deep_merge(self, base: Dict, update: Dict):
+        """
+        Deep merge two dictionaries.
+
+        Iterative with an explicit stack, so deeply nested configs cost no
+        Python call frames. Exact `type(...) is dict` checks skip the MRO
+        walk isinstance does; config trees only ever hold plain dicts.
+        """
+        stack = [(base, update)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                # Leaves dominate real configs, so take that branch first
+                if type(value) is not dict:
+                    dst[key] = value
+                    continue
+
+                existing = dst.get(key)
+                if type(existing) is dict:
+                    stack.append((existing, value))
+                else:
+                    dst[key] = value
 
 
 # Create default global config loader
@@ -250,12 +457,13 @@ def get_config_loader(
     global _global_loader
     
     if _global_loader is None:
+        # Sources are loaded lazily on first read, so creating the global
+        # loader is cheap for callers that never touch config
         _global_loader = ConfigLoader(
             base_dir=base_dir,
             env=env or os.getenv('AI_ENV', 'development')
         )
-        _global_loader.discover_and_load()
-    
+
     return _global_loader
 
 
@@ -5,15 +5,41 @@ Revolutionary dependency injection system for AI agents and services.
 
 import inspect
 import logging
+import sys
 from typing import Any, Dict, List, Optional, Type, Callable, get_type_hints
 from dataclasses import dataclass, field
 from enum import Enum
 import threading
+from contextlib import contextmanager
 from functools import wraps
 
 
 logger = logging.getLogger(__name__)
 
+# Sentinel returned by parameter resolvers when nothing can be injected
+_MISSING = object()
+
+
+def _hints_for(func: Callable) -> Dict[str, Any]:
+    """Resolved type hints for a function"""
+    try:
+        return get_type_hints(func)
+    except Exception:
+        return {}
+
+
+def _required_params(factory: Callable) -> tuple:
+    """Parameter names without defaults (excluding self)"""
+    try:
+        sig = inspect.signature(factory)
+    except (ValueError, TypeError):
+        return ()
+    return tuple(
+        param_name
+        for param_name, param in sig.parameters.items()
+        if param_name != 'self' and param.default == inspect.Parameter.empty
+    )
+
 
 class Scope(Enum):
     """Dependency scope types"""
@@ -22,7 +48,7 @@ class Scope(Enum):
     SCOPED = "scoped"
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyMetadata:
     """Metadata for registered dependencies"""
     name: str
@@ -32,6 +58,9 @@ class DependencyMetadata:
     dependencies: List[str] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
     lazy: bool = False
+    # Zero-argument constructor thunk compiled at register() time; calls
+    # the factory with its dependencies resolved, no per-call reflection
+    ctor: Optional[Callable] = None
 
 
 class CircularDependencyError(Exception):
@@ -61,9 +90,20 @@ class AutoWire:
     def __init__(self):
         self._registry: Dict[str, DependencyMetadata] = {}
         self._type_registry: Dict[Type, str] = {}
-        self._resolving: set = set()
+        # Per-thread in-progress resolution stack; thread-local so one
+        # thread's resolution chain never false-positives another's
+        self._local = threading.local()
         self._lock = threading.RLock()
         self._scoped_instances: Dict[str, Any] = {}
+        # Initialized singletons, readable without the lock: dict reads are
+        # atomic under the GIL and entries are only added while holding it
+        self._singleton_cache: Dict[str, Any] = {}
+        # Per-name creation plans (topological dependency order), built
+        # lazily on first resolve and invalidated by register()
+        self._plans: Dict[str, tuple] = {}
+        # tag -> dependency names, maintained by register() so
+        # resolve_all() avoids a full registry scan
+        self._tag_index: Dict[str, List[str]] = {}
         
         logger.info("AutoWire engine initialized")
     
@@ -90,9 +130,13 @@ class AutoWire:
         Returns:
             Self for method chaining
         """
+        # Interned names make the registry/cache dict lookups on the
+        # resolve hot path compare by pointer instead of by characters
+        name = sys.intern(name)
+
         with self._lock:
             # Analyze dependencies from factory signature
-            dependencies = self._analyze_dependencies(factory)
+            dependencies = [sys.intern(dep) for dep in self._analyze_dependencies(factory)]
             
             metadata = DependencyMetadata(
                 name=name,
@@ -102,9 +146,37 @@ class AutoWire:
                 tags=tags or [],
                 lazy=lazy
             )
-            
+
+            # Compile the constructor thunk once: factories without
+            # dependencies are invoked directly, others through a closure
+            # that resolves each dependency by name
+            if dependencies:
+                dep_names = tuple(dependencies)
+                resolve = self.resolve
+                metadata.ctor = lambda: factory(
+                    **{dep: resolve(dep) for dep in dep_names}
+                )
+            else:
+                metadata.ctor = factory
+
+            # Drop stale tag entries when a name is re-registered
+            previous = self._registry.get(name)
+            if previous is not None:
+                for tag in previous.tags:
+                    names = self._tag_index.get(tag)
+                    if names and name in names:
+                        names.remove(name)
+
             self._registry[name] = metadata
-            
+            self._plans.clear()
+            # Drop any previously resolved instance so re-registering a
+            # name (lazy or with a different scope) cannot serve a stale
+            # singleton from the lock-free fast path
+            self._singleton_cache.pop(name, None)
+
+            for tag in metadata.tags:
+                self._tag_index.setdefault(tag, []).append(name)
+
             # Register type mapping if interface provided
             if interface:
                 self._type_registry[interface] = name
@@ -152,28 +224,89 @@ class AutoWire:
             DependencyNotFoundError: If dependency is not registered
             CircularDependencyError: If circular dependency detected
         """
+        # Fast path: an initialized singleton never changes, so skip the lock
+        name = sys.intern(name)
+        instance = self._singleton_cache.get(name)
+        if instance is not None:
+            return instance
+
         with self._lock:
             if name not in self._registry:
                 raise DependencyNotFoundError(f"Dependency '{name}' not found in registry")
             
             metadata = self._registry[name]
-            
+
             # Check for circular dependencies
-            if name in self._resolving:
+            resolving = getattr(self._local, 'resolving', None)
+            if resolving and name in resolving:
                 raise CircularDependencyError(
-                    f"Circular dependency detected: {' -> '.join(self._resolving)} -> {name}"
+                    f"Circular dependency detected: {' -> '.join(resolving)} -> {name}"
                 )
-            
+
             # Return existing singleton instance
             if metadata.scope == Scope.SINGLETON and metadata.instance is not None:
                 return metadata.instance
-            
+
             # Return existing scoped instance
             if metadata.scope == Scope.SCOPED and name in self._scoped_instances:
                 return self._scoped_instances[name]
-            
+
+            # Pre-create missing singleton/scoped dependencies in plan
+            # order, so creation below finds them all in cache
+            plan = self._plans.get(name)
+            if plan is None:
+                plan = self._build_plan(name)
+
+            for dep_name in plan[:-1]:
+                dep_meta = self._registry[dep_name]
+                if dep_meta.scope == Scope.SINGLETON:
+                    if dep_meta.instance is None:
+                        self._create_instance(dep_meta)
+                elif dep_meta.scope == Scope.SCOPED:
+                    if dep_name not in self._scoped_instances:
+                        self._create_instance(dep_meta)
+
             # Create new instance
             return self._create_instance(metadata)
+
+    def _build_plan(self, name: str) -> tuple:
+        """
+        Build the topological creation order for a dependency.
+
+        Walks the dependency graph depth-first, raising
+        CircularDependencyError on cycles and DependencyNotFoundError for
+        unregistered dependencies. The resulting plan (dependencies first,
+        target last) is cached until the next register() call.
+        """
+        order: List[str] = []
+        visited: set = set()
+        on_path: set = set()
+
+        def visit(node: str, chain: List[str]):
+            if node in visited:
+                return
+            if node in on_path:
+                raise CircularDependencyError(
+                    f"Circular dependency detected: {' -> '.join(chain)} -> {node}"
+                )
+
+            metadata = self._registry.get(node)
+            if metadata is None:
+                raise DependencyNotFoundError(f"Dependency '{node}' not found in registry")
+
+            on_path.add(node)
+            for dep_name in metadata.dependencies:
+                visit(dep_name, chain + [node])
+            on_path.discard(node)
+
+            visited.add(node)
+            order.append(node)
+
+        visit(name, [])
+
+        plan = tuple(order)
+        self._plans[name] = plan
+        return plan
     
     def resolve_by_type(self, interface: Type) -> Any:
         """
@@ -185,14 +318,15 @@ class AutoWire:
         Returns:
             Resolved dependency instance
         """
-        with self._lock:
-            if interface not in self._type_registry:
-                raise DependencyNotFoundError(
-                    f"No dependency registered for type '{interface.__name__}'"
-                )
-            
-            name = self._type_registry[interface]
-            return self.resolve(name)
+        # Lock-free lookup: the type map only grows, and it grows under
+        # the registration lock
+        name = self._type_registry.get(interface)
+        if name is None:
+            raise DependencyNotFoundError(
+                f"No dependency registered for type '{interface.__name__}'"
+            )
+
+        return self.resolve(name)
     
     def resolve_all(self, tag: str) -> List[Any]:
         """
@@ -205,42 +339,101 @@ class AutoWire:
             List of resolved dependency instances
         """
         with self._lock:
-            instances = []
-            for name, metadata in self._registry.items():
-                if tag in metadata.tags:
-                    instances.append(self.resolve(name))
-            return instances
+            return [self.resolve(name) for name in self._tag_index.get(tag, ())]
     
     def inject(self, func: Callable) -> Callable:
         """
         Decorator to automatically inject dependencies into function parameters.
-        
+
         Usage:
             @autowire.inject
             def my_function(service: MyService):
                 service.do_something()
+
+        The wrapper is generated once at decoration time with a straight-line
+        statement per injectable parameter, so calls pay no hint iteration
+        or exception handling for resolvable dependencies.
         """
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Get type hints from function signature
-            hints = get_type_hints(func)
-            
-            # Inject dependencies not provided in kwargs
-            for param_name, param_type in hints.items():
-                if param_name not in kwargs:
-                    try:
-                        kwargs[param_name] = self.resolve_by_type(param_type)
-                    except DependencyNotFoundError:
-                        # Try by name if type resolution fails
-                        try:
-                            kwargs[param_name] = self.resolve(param_name)
-                        except DependencyNotFoundError:
-                            pass  # Let function handle missing parameter
-            
-            return func(*args, **kwargs)
-        
-        return wrapper
+        hints = _hints_for(func)
+        params = [(name, hint) for name, hint in hints.items() if name != 'return']
+
+        if not params:
+            return func  # Nothing to inject
+
+        # Generate one `if` per parameter with a prebound resolver closure
+        namespace: Dict[str, Any] = {'_func': func, '_MISSING': _MISSING}
+        lines = ["def wrapper(*args, **kwargs):"]
+        for i, (param_name, param_type) in enumerate(params):
+            namespace[f'_resolve{i}'] = self._param_resolver(param_name, param_type)
+            lines.append(f"    if {param_name!r} not in kwargs:")
+            lines.append(f"        value = _resolve{i}()")
+            lines.append(f"        if value is not _MISSING:")
+            lines.append(f"            kwargs[{param_name!r}] = value")
+        lines.append("    return _func(*args, **kwargs)")
+
+        exec('\n'.join(lines), namespace)
+        return wraps(func)(namespace['wrapper'])
+
+    def _param_resolver(self, param_name: str, param_type: Type) -> Callable[[], Any]:
+        """Build a zero-argument resolver for one injectable parameter"""
+        def resolve_param() -> Any:
+            try:
+                return self.resolve_by_type(param_type)
+            except DependencyNotFoundError:
+                # Try by name if type resolution fails
+                try:
+                    return self.resolve(param_name)
+                except DependencyNotFoundError:
+                    return _MISSING  # Let function handle missing parameter
+        return resolve_param
     
+    @contextmanager
+    def scope(self):
+        """
+        Temporarily layer registrations on a shared engine.
+
+        Snapshots the registry, caches and indexes, yields the engine,
+        and restores the snapshot on exit. Callers (test fixtures,
+        nested setups) can register overrides inside the block without
+        rebuilding the container, and the engine comes back untouched.
+
+        Usage:
+            with autowire.scope():
+                autowire.register('service', FakeService)
+                ...
+        """
+        with self._lock:
+            saved = (
+                dict(self._registry),
+                dict(self._type_registry),
+                dict(self._singleton_cache),
+                dict(self._scoped_instances),
+                dict(self._plans),
+                {tag: list(names) for tag, names in self._tag_index.items()},
+            )
+            # The registry snapshot is shallow and metadata objects are
+            # shared with the outer engine, so a lazy singleton resolved
+            # inside the scope would otherwise leak via metadata.instance
+            saved_instances = {
+                name: md.instance for name, md in self._registry.items()
+            }
+        try:
+            yield self
+        finally:
+            with self._lock:
+                (
+                    self._registry,
+                    self._type_registry,
+                    self._singleton_cache,
+                    self._scoped_instances,
+                    self._plans,
+                    self._tag_index,
+                ) = saved
+                for name, instance in saved_instances.items():
+                    metadata = self._registry.get(name)
+                    if metadata is not None:
+                        metadata.instance = instance
+
     def create_scoped(self) -> 'ScopedContainer':
         """
         Create a new scoped container for scoped dependencies.
@@ -252,46 +445,32 @@ class AutoWire:
     
     def _create_instance(self, metadata: DependencyMetadata) -> Any:
         """Create an instance with dependency injection"""
-        self._resolving.add(metadata.name)
-        
+        resolving = getattr(self._local, 'resolving', None)
+        if resolving is None:
+            resolving = self._local.resolving = []
+        resolving.append(metadata.name)
+
         try:
-            # Resolve dependencies
-            deps = {}
-            for dep_name in metadata.dependencies:
-                deps[dep_name] = self.resolve(dep_name)
-            
-            # Create instance
-            if inspect.isclass(metadata.factory):
-                instance = metadata.factory(**deps)
-            else:
-                instance = metadata.factory(**deps)
-            
+            # Create instance via the precompiled thunk
+            instance = metadata.ctor()
+
             # Store based on scope
             if metadata.scope == Scope.SINGLETON:
                 metadata.instance = instance
+                self._singleton_cache[metadata.name] = instance
             elif metadata.scope == Scope.SCOPED:
                 self._scoped_instances[metadata.name] = instance
             
             logger.debug(f"Created instance of '{metadata.name}'")
             
             return instance
-        
+
         finally:
-            self._resolving.discard(metadata.name)
+            resolving.pop()
     
     def _analyze_dependencies(self, factory: Callable) -> List[str]:
         """Analyze factory signature to extract dependencies"""
-        dependencies = []
-        
-        try:
-            sig = inspect.signature(factory)
-            for param_name, param in sig.parameters.items():
-                if param_name != 'self' and param.default == inspect.Parameter.empty:
-                    dependencies.append(param_name)
-        except (ValueError, TypeError):
-            pass  # Unable to inspect signature
-        
-        return dependencies
+        return list(_required_params(factory))
     
     def clear_scoped(self):
         """Clear all scoped instances"""
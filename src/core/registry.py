@@ -4,16 +4,23 @@ Central registration and discovery for all system components.
 """
 
 import logging
+import os
+import pickle
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Type, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 import threading
+import weakref
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceInfo:
     """Information about a registered service"""
     name: str
@@ -25,9 +32,11 @@ class ServiceInfo:
     metadata: Dict[str, Any] = field(default_factory=dict)
     registered_at: datetime = field(default_factory=datetime.now)
     health_check: Optional[Callable[[], bool]] = None
+    # True when the instance lives in the registry's WeakValueDictionary
+    weak: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentInfo:
     """Information about a registered component"""
     name: str
@@ -44,13 +53,34 @@ class ServiceRegistry:
     Central registry for services with health checking and discovery.
     """
     
-    def __init__(self):
+    def __init__(self, health_cache_ttl: float = 5.0):
         self._services: Dict[str, ServiceInfo] = {}
-        self._type_index: Dict[Type, List[str]] = {}
-        self._capability_index: Dict[str, List[str]] = {}
-        self._lock = threading.RLock()
-        
+        # Index values are dicts used as ordered sets: O(1) add/remove
+        # while keeping registration order for queries
+        self._type_index: Dict[Type, Dict[str, None]] = {}
+        self._capability_index: Dict[str, Dict[str, None]] = {}
+        # Copy-on-write snapshots: writers rebuild these under the write
+        # lock and publish them with a single attribute store, so readers
+        # never need to lock (attribute/dict reads are GIL-atomic)
+        self._snapshot: Dict[str, ServiceInfo] = {}
+        self._type_snapshot: Dict[Type, tuple] = {}
+        self._capability_snapshot: Dict[str, tuple] = {}
+        self._write_lock = threading.RLock()
+        # Health results cached for health_cache_ttl seconds so polling
+        # callers don't hammer slow checks; 0 disables caching
+        self.health_cache_ttl = health_cache_ttl
+        self._health_cache: Dict[str, tuple] = {}
+        # Instances registered with weak=True live here; the registry
+        # then never keeps a service alive on its own
+        self._weak_instances: 'weakref.WeakValueDictionary[str, Any]' = weakref.WeakValueDictionary()
+
         logger.info("ServiceRegistry initialized")
+
+    def _publish(self):
+        """Rebuild the read-only snapshots after a mutation"""
+        self._snapshot = dict(self._services)
+        self._type_snapshot = {t: tuple(names) for t, names in self._type_index.items()}
+        self._capability_snapshot = {c: tuple(names) for c, names in self._capability_index.items()}
     
     def register(
         self,
@@ -61,7 +91,8 @@ class ServiceRegistry:
         description: str = "",
         capabilities: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
-        health_check: Optional[Callable[[], bool]] = None
+        health_check: Optional[Callable[[], bool]] = None,
+        weak: bool = False
     ) -> 'ServiceRegistry':
         """
         Register a service with the registry.
@@ -75,109 +106,193 @@ class ServiceRegistry:
             capabilities: List of service capabilities
             metadata: Additional metadata
             health_check: Optional health check function
+            weak: Hold the instance via weak reference only, so the
+                registry does not keep otherwise-unreferenced services
+                alive (the object must support weak references)
         
         Returns:
             Self for method chaining
         """
-        with self._lock:
-            caps = capabilities or []
+        with self._write_lock:
+            # Interned keys make the index lookups pointer comparisons
+            name = sys.intern(name)
+            caps = [sys.intern(cap) for cap in capabilities] if capabilities else []
             
+            if weak:
+                self._weak_instances[name] = service
+
             info = ServiceInfo(
                 name=name,
                 service_type=service_type,
-                instance=service,
+                instance=None if weak else service,
                 version=version,
                 description=description,
                 capabilities=caps,
                 metadata=metadata or {},
-                health_check=health_check
+                health_check=health_check,
+                weak=weak
             )
             
             self._services[name] = info
-            
+            self._health_cache.pop(name, None)
+
             # Update type index
-            if service_type not in self._type_index:
-                self._type_index[service_type] = []
-            self._type_index[service_type].append(name)
-            
+            self._type_index.setdefault(service_type, {})[name] = None
+
             # Update capability index
             for cap in caps:
-                if cap not in self._capability_index:
-                    self._capability_index[cap] = []
-                self._capability_index[cap].append(name)
-            
-            logger.info(f"Registered service: {name} ({service_type.__name__})")
+                self._capability_index.setdefault(cap, {})[name] = None
             
+            self._publish()
+
+            logger.info("Registered service: %s (%s)", name, service_type.__name__)
+
             return self
     
+    def _instance_of(self, info: ServiceInfo) -> Optional[Any]:
+        """Live instance for a service, or None if a weak one was collected"""
+        if info.weak:
+            return self._weak_instances.get(info.name)
+        return info.instance
+
     def get(self, name: str) -> Optional[Any]:
-        """Get a service by name"""
-        with self._lock:
-            info = self._services.get(name)
-            return info.instance if info else None
-    
+        """Get a service by name (lock-free)"""
+        info = self._snapshot.get(name)
+        return self._instance_of(info) if info else None
+
     def get_by_type(self, service_type: Type) -> List[Any]:
-        """Get all services implementing a specific type"""
-        with self._lock:
-            names = self._type_index.get(service_type, [])
-            return [self._services[name].instance for name in names]
-    
+        """Get all services implementing a specific type (lock-free)"""
+        snapshot = self._snapshot
+        names = self._type_snapshot.get(service_type, ())
+        instances = (self._instance_of(snapshot[name]) for name in names)
+        return [instance for instance in instances if instance is not None]
+
     def get_by_capability(self, capability: str) -> List[Any]:
-        """Get all services with a specific capability"""
-        with self._lock:
-            names = self._capability_index.get(capability, [])
-            return [self._services[name].instance for name in names]
-    
+        """Get all services with a specific capability (lock-free)"""
+        snapshot = self._snapshot
+        names = self._capability_snapshot.get(sys.intern(capability), ())
+        instances = (self._instance_of(snapshot[name]) for name in names)
+        return [instance for instance in instances if instance is not None]
+
     def get_info(self, name: str) -> Optional[ServiceInfo]:
-        """Get service information"""
-        with self._lock:
-            return self._services.get(name)
-    
+        """Get service information (lock-free)"""
+        return self._snapshot.get(name)
+
     def list_services(self) -> List[str]:
-        """List all registered service names"""
-        with self._lock:
-            return list(self._services.keys())
-    
+        """List all registered service names (lock-free)"""
+        return list(self._snapshot.keys())
+
     def check_health(self, name: str) -> bool:
-        """Check health of a specific service"""
-        with self._lock:
-            info = self._services.get(name)
-            if not info or not info.health_check:
-                return True  # No health check defined, assume healthy
-            
-            try:
-                return info.health_check()
-            except Exception as e:
-                logger.error(f"Health check failed for {name}: {e}")
-                return False
-    
+        """Check health of a specific service (TTL-cached)"""
+        info = self._snapshot.get(name)
+        if not info or not info.health_check:
+            return True  # No health check defined, assume healthy
+
+        now = time.monotonic()
+        cached = self._health_cache.get(name)
+        if cached is not None and now - cached[0] < self.health_cache_ttl:
+            return cached[1]
+
+        try:
+            result = bool(info.health_check())
+        except Exception as e:
+            logger.error("Health check failed for %s: %s", name, e)
+            result = False
+
+        self._health_cache[name] = (now, result)
+        return result
+
     def check_all_health(self) -> Dict[str, bool]:
-        """Check health of all services"""
-        with self._lock:
-            results = {}
-            for name in self._services.keys():
-                results[name] = self.check_health(name)
-            return results
-    
+        """Check health of all services, running checks concurrently"""
+        names = list(self._snapshot.keys())
+        if len(names) <= 1:
+            return {name: self.check_health(name) for name in names}
+
+        # Checks run outside any lock; slow or blocking health probes
+        # overlap instead of serializing the sweep
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+            return dict(zip(names, executor.map(self.check_health, names)))
+
+    # Bump when the persisted index layout changes; load_index rejects
+    # pickles written by a different layout
+    INDEX_FORMAT_VERSION = 1
+
+    def save_index(self, path: str) -> bool:
+        """
+        Persist a lightweight discovery index of the registered services.
+
+        Only metadata is written (name, version, description, capabilities
+        and the service type's import path), never live instances or
+        health-check callables, so the pickle stays small and loadable in
+        a fresh process.
+        """
+        snapshot = self._snapshot
+        entries = {
+            name: {
+                'version': info.version,
+                'description': info.description,
+                'capabilities': list(info.capabilities),
+                'type': f"{info.service_type.__module__}.{info.service_type.__qualname__}",
+            }
+            for name, info in snapshot.items()
+        }
+        payload = {'format_version': self.INDEX_FORMAT_VERSION, 'services': entries}
+
+        try:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            logger.info("Saved service index: %s (%d services)", path, len(entries))
+            return True
+        except OSError as e:
+            logger.error("Failed to save service index %s: %s", path, e)
+            return False
+
+    def load_index(self, path: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Load a discovery index written by save_index.
+
+        Returns the {name: metadata} mapping, or None if the file is
+        missing, unreadable or written with a different format version.
+        """
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.debug("Service index not loaded from %s: %s", path, e)
+            return None
+
+        if not isinstance(payload, dict) or payload.get('format_version') != self.INDEX_FORMAT_VERSION:
+            logger.warning("Service index %s has an unsupported format, ignoring", path)
+            return None
+
+        return payload['services']
+
     def unregister(self, name: str) -> bool:
         """Unregister a service"""
-        with self._lock:
+        with self._write_lock:
             if name not in self._services:
                 return False
             
             info = self._services.pop(name)
-            
-            # Clean up indexes
-            type_list = self._type_index.get(info.service_type, [])
-            if name in type_list:
-                type_list.remove(name)
-            
+            self._health_cache.pop(name, None)
+            if info.weak:
+                self._weak_instances.pop(name, None)
+
+            # Clean up indexes: O(1) removals on the dict-backed sets
+            type_set = self._type_index.get(info.service_type)
+            if type_set is not None:
+                type_set.pop(name, None)
+
             for cap in info.capabilities:
-                cap_list = self._capability_index.get(cap, [])
-                if name in cap_list:
-                    cap_list.remove(name)
+                cap_set = self._capability_index.get(cap)
+                if cap_set is not None:
+                    cap_set.pop(name, None)
             
-            logger.info(f"Unregistered service: {name}")
+            self._publish()
+
+            logger.info("Unregistered service: %s", name)
             return True
 
 
@@ -188,9 +303,14 @@ class ComponentRegistry:
     
     def __init__(self):
         self._components: Dict[str, ComponentInfo] = {}
-        self._type_index: Dict[str, List[str]] = {}
+        # Dict-as-ordered-set, matching ServiceRegistry's indexes
+        self._type_index: Dict[str, Dict[str, None]] = {}
         self._lock = threading.RLock()
-        
+        # Bumped on any mutation that can change dependency order;
+        # cached orders are valid only for the version they were built at
+        self._version = 0
+        self._order_cache: Dict[Optional[str], tuple] = {}
+
         logger.info("ComponentRegistry initialized")
     
     def register(
@@ -219,6 +339,9 @@ class ComponentRegistry:
             Self for method chaining
         """
         with self._lock:
+            name = sys.intern(name)
+            component_type = sys.intern(component_type)
+
             info = ComponentInfo(
                 name=name,
                 component_type=component_type,
@@ -230,13 +353,12 @@ class ComponentRegistry:
             )
             
             self._components[name] = info
-            
+            self._version += 1
+
             # Update type index
-            if component_type not in self._type_index:
-                self._type_index[component_type] = []
-            self._type_index[component_type].append(name)
+            self._type_index.setdefault(component_type, {})[name] = None
             
-            logger.info(f"Registered component: {name} (type={component_type})")
+            logger.info("Registered component: %s (type=%s)", name, component_type)
             
             return self
     
@@ -248,7 +370,7 @@ class ComponentRegistry:
     def get_by_type(self, component_type: str, enabled_only: bool = True) -> List[ComponentInfo]:
         """Get all components of a specific type"""
         with self._lock:
-            names = self._type_index.get(component_type, [])
+            names = self._type_index.get(sys.intern(component_type), ())
             components = [self._components[name] for name in names]
             
             if enabled_only:
@@ -277,7 +399,8 @@ class ComponentRegistry:
             info = self._components.get(name)
             if info:
                 info.enabled = True
-                logger.info(f"Enabled component: {name}")
+                self._version += 1
+                logger.info("Enabled component: %s", name)
                 return True
             return False
     
@@ -287,21 +410,23 @@ class ComponentRegistry:
             info = self._components.get(name)
             if info:
                 info.enabled = False
-                logger.info(f"Disabled component: {name}")
+                self._version += 1
+                logger.info("Disabled component: %s", name)
                 return True
             return False
     
     def list_types(self) -> List[str]:
-        """List all component types"""
-        with self._lock:
-            return list(self._type_index.keys())
-    
+        """List all component types (lock-free)"""
+        # list() snapshots the keys in C in one step; combined with
+        # GIL-atomic dict reads, no lock is needed for these views
+        return list(self._type_index.keys())
+
     def list_components(self, component_type: Optional[str] = None) -> List[str]:
-        """List all component names, optionally filtered by type"""
-        with self._lock:
-            if component_type:
-                return self._type_index.get(component_type, [])
-            return list(self._components.keys())
+        """List all component names, optionally filtered by type (lock-free)"""
+        if component_type:
+            names = self._type_index.get(component_type)
+            return list(names) if names else []
+        return list(self._components.keys())
     
     def get_dependency_order(self, component_type: Optional[str] = None) -> List[str]:
         """
@@ -314,34 +439,42 @@ class ComponentRegistry:
             List of component names in dependency order
         """
         with self._lock:
+            # Serve from cache while the registry is unchanged
+            cached = self._order_cache.get(component_type)
+            if cached is not None and cached[0] == self._version:
+                return list(cached[1])
+
             # Get components to sort
             if component_type:
                 components = self.get_by_type(component_type)
                 comp_names = [c.name for c in components]
             else:
                 comp_names = list(self._components.keys())
-            
+
             # Build dependency graph
             graph = {name: set(self._components[name].dependencies) for name in comp_names}
-            
+
             # Topological sort using Kahn's algorithm
             in_degree = {name: 0 for name in comp_names}
             for deps in graph.values():
                 for dep in deps:
                     if dep in in_degree:
                         in_degree[dep] += 1
-            
-            queue = [name for name in comp_names if in_degree[name] == 0]
+
+            # deque gives O(1) popleft where list.pop(0) was O(n)
+            queue = deque(name for name in comp_names if in_degree[name] == 0)
             result = []
-            
+
             while queue:
-                node = queue.pop(0)
+                node = queue.popleft()
                 result.append(node)
-                
+
                 for neighbor in graph.get(node, []):
                     if neighbor in in_degree:
                         in_degree[neighbor] -= 1
                         if in_degree[neighbor] == 0:
                             queue.append(neighbor)
-            
+
+            self._order_cache[component_type] = (self._version, tuple(result))
+
             return result
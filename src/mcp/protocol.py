@@ -3,19 +3,29 @@ Model Context Protocol (MCP) Integration
 Advanced AI communication protocol implementation.
 """
 
+import itertools
 import json
+import time
+from collections import deque
 import logging
-import asyncio
-from typing import Any, Dict, List, Optional, Callable, Union
-from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Callable, Sequence, Union
+import copy as _copy
+from dataclasses import dataclass, field
 from enum import Enum
-from datetime import datetime
-import threading
-from queue import Queue
+from datetime import datetime, timedelta
+
+try:
+    import orjson  # Rust JSON serializer, used for the bytes fast paths
+except ImportError:
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
+# Process-wide counter keeping default session IDs unique even when two
+# protocols are created within the same clock tick
+_session_counter = itertools.count()
+
 
 class MCPMessageType(Enum):
     """MCP message types"""
@@ -35,7 +45,22 @@ class MCPRole(Enum):
     AGENT = "agent"
 
 
-@dataclass
+# Direct value -> member maps: Enum.__call__ goes through a DynamicClassAttribute
+# and exception machinery on each lookup, these are plain dict hits
+_TYPE_MAP = MCPMessageType._value2member_map_
+_ROLE_MAP = MCPRole._value2member_map_
+
+
+def _mcp_default(obj: Any) -> Any:
+    """JSON fallback for MCP payload types (datetimes, enums)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@dataclass(slots=True)
 class MCPMessage:
     """Model Context Protocol message"""
     id: str
@@ -46,25 +71,44 @@ class MCPMessage:
     metadata: Dict[str, Any] = field(default_factory=dict)
     parent_id: Optional[str] = None
     context: Optional[Dict[str, Any]] = None
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = asdict(self)
-        data['type'] = self.type.value
-        data['role'] = self.role.value
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+    # Memoized to_dict result; messages are treated as immutable once sent
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    def to_dict(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary.
+
+        Builds a flat dict literal instead of dataclasses.asdict, which
+        recursively deep-copies every field, and memoizes the result so
+        repeated exports of the same message are free. Mutable fields
+        (content, metadata, context) are shared with the message unless
+        copy=True.
+        """
+        data = self._cached_dict
+        if data is None:
+            data = self._cached_dict = {
+                'id': self.id,
+                'type': self.type.value,
+                'role': self.role.value,
+                'content': self.content,
+                'timestamp': self.timestamp.isoformat(),
+                'metadata': self.metadata,
+                'parent_id': self.parent_id,
+                'context': self.context,
+            }
+        return _copy.deepcopy(data) if copy else data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MCPMessage':
-        """Create from dictionary"""
-        data['type'] = MCPMessageType(data['type'])
-        data['role'] = MCPRole(data['role'])
-        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-        return cls(**data)
+        """Create from dictionary (the caller's dict is not mutated)"""
+        kwargs = dict(data)
+        kwargs['type'] = _TYPE_MAP[data['type']]
+        kwargs['role'] = _ROLE_MAP[data['role']]
+        kwargs['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        return cls(**kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPContext:
     """Conversation context for MCP"""
     session_id: str
@@ -72,29 +116,99 @@ class MCPContext:
     variables: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
-    
+    max_messages: int = 10000
+    # Monotonic anchors: hot paths only bump a counter; the wall-clock
+    # updated_at is derived on demand (see the property below)
+    _created_ns: int = field(default_factory=time.monotonic_ns, repr=False, compare=False)
+    _updated_ns: int = field(default=0, repr=False, compare=False)
+    # Full-history tuple reused by read-heavy callers until the next write
+    _history_snapshot: Optional[tuple] = field(default=None, repr=False, compare=False)
+    _snapshot_ns: int = field(default=-1, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Bounded ring buffer: appends stay O(1) and a long-lived session
+        # cannot grow its history without limit
+        self.messages = deque(self.messages, maxlen=self.max_messages)
+        self._updated_ns = self._created_ns
+
+    @property
+    def updated_at(self) -> datetime:
+        """
+        Last-modified wall-clock time.
+
+        add_message/set_variable record time.monotonic_ns() (tens of ns)
+        instead of calling datetime.now() (~1 us) per mutation; the
+        datetime is materialized here from the created_at anchor only
+        when something actually reads it.
+        """
+        return self.created_at + timedelta(
+            microseconds=(self._updated_ns - self._created_ns) // 1000
+        )
+
     def add_message(self, message: MCPMessage):
         """Add message to context"""
         self.messages.append(message)
-        self.updated_at = datetime.now()
-    
-    def get_history(self, limit: Optional[int] = None) -> List[MCPMessage]:
-        """Get message history"""
+        self._updated_ns = time.monotonic_ns()
+
+    def add_messages(self, messages: List[MCPMessage]):
+        """Add several messages with a single deque extend and one timestamp bump"""
+        self.messages.extend(messages)
+        self._updated_ns = time.monotonic_ns()
+
+    def get_history(self, limit: Optional[int] = None, copy: bool = False) -> List[MCPMessage]:
+        """
+        Get message history.
+
+        With copy=False (the default) and no limit, this returns the
+        live message deque without copying — O(1) instead of one
+        refcount bump per message for a caller that only iterates. The
+        caller must treat it as read-only; pass copy=True for an
+        independent list (the public MCPProtocol.get_history does).
+        """
         if limit:
-            return self.messages[-limit:]
-        return self.messages.copy()
-    
+            start = len(self.messages) - limit
+            return list(itertools.islice(self.messages, max(start, 0), None))
+        return list(self.messages) if copy else self.messages
+
+    def snapshot(self) -> tuple:
+        """
+        Immutable view of the full history.
+
+        The tuple is built once per write epoch (_updated_ns) and reused
+        for every read until the next mutation, so repeated full-history
+        probes allocate nothing.
+        """
+        if self._snapshot_ns != self._updated_ns:
+            self._history_snapshot = tuple(self.messages)
+            self._snapshot_ns = self._updated_ns
+        return self._history_snapshot
+
     def set_variable(self, key: str, value: Any):
         """Set context variable"""
         self.variables[key] = value
-        self.updated_at = datetime.now()
+        self._updated_ns = time.monotonic_ns()
     
     def get_variable(self, key: str, default: Any = None) -> Any:
         """Get context variable"""
         return self.variables.get(key, default)
 
 
+@dataclass(slots=True, frozen=True)
+class Predicate:
+    """
+    Compiled dispatch predicate for a handler.
+
+    kind is 'str_prefix' (string content, matched on the first
+    space-separated token) or 'dict_type' (dict content, matched on the
+    'type' field). Predicates compile down to tuple keys in the
+    protocol's dispatch tables, so routing a message is a single dict
+    lookup instead of N can_handle probes.
+    """
+    msg_type: MCPMessageType
+    kind: str
+    value: str
+
+
 class MCPHandler:
     """
     Handler interface for MCP messages.
@@ -103,11 +217,43 @@ class MCPHandler:
     def can_handle(self, message: MCPMessage, context: MCPContext) -> bool:
         """Check if handler can process this message"""
         raise NotImplementedError
-    
+
     def handle(self, message: MCPMessage, context: MCPContext) -> Optional[MCPMessage]:
         """Handle the message and optionally return a response"""
         raise NotImplementedError
 
+    def subscriptions(self) -> Optional[List[str]]:
+        """
+        Optional dispatch keys for indexed routing.
+
+        Return keys like 'request:str:/echo' (string content, first token)
+        or 'request:dict:set_variable' (dict content, 'type' field) so the
+        protocol can route matching messages straight to this handler.
+        Returning None (the default) keeps the linear can_handle scan.
+        """
+        return None
+
+    def predicates(self) -> Optional[List[Predicate]]:
+        """
+        Structured dispatch predicates, compiled from subscriptions().
+
+        Handlers may override this directly; the default parses the
+        string keys from subscriptions() so existing handlers get table
+        dispatch for free.
+        """
+        keys = self.subscriptions()
+        if not keys:
+            return None
+        predicates = []
+        for key in keys:
+            msg_type, kind, value = key.split(':', 2)
+            predicates.append(Predicate(
+                msg_type=_TYPE_MAP[msg_type],
+                kind='str_prefix' if kind == 'str' else 'dict_type',
+                value=value
+            ))
+        return predicates
+
 
 class MCPProtocol:
     """
@@ -123,9 +269,19 @@ class MCPProtocol:
     """
     
     def __init__(self, session_id: Optional[str] = None):
-        self.session_id = session_id or f"mcp_{datetime.now().timestamp()}"
+        self.session_id = session_id or f"mcp_{datetime.now().timestamp()}_{next(_session_counter)}"
         self.context = MCPContext(session_id=self.session_id)
+        # Monotonic message IDs: a precomputed prefix plus a counter is
+        # far cheaper than a datetime.now() call per send
+        self._id_prefix = f"msg_{self.session_id}_"
+        self._id_counter = itertools.count()
         self._handlers: List[MCPHandler] = []
+        # Compiled predicate tables: (msg_type, token) -> [(seq, handler)].
+        # Handlers without predicates stay in _linear_handlers and are
+        # always probed
+        self._str_prefix_table: Dict[tuple, List] = {}
+        self._dict_type_table: Dict[tuple, List] = {}
+        self._linear_handlers: List = []
         self._hooks: Dict[str, List[Callable]] = {
             'before_send': [],
             'after_send': [],
@@ -133,23 +289,59 @@ class MCPProtocol:
             'after_receive': [],
             'on_error': []
         }
-        self._message_queue: Queue = Queue()
-        self._running = False
-        self._worker_thread: Optional[threading.Thread] = None
-        
-        logger.info(f"MCPProtocol initialized (session={self.session_id})")
+
+        logger.info("MCPProtocol initialized (session=%s)", self.session_id)
     
     def register_handler(self, handler: MCPHandler) -> 'MCPProtocol':
         """Register a message handler"""
+        seq = len(self._handlers)
         self._handlers.append(handler)
-        logger.info(f"Registered handler: {handler.__class__.__name__}")
+
+        predicates = handler.predicates()
+        if predicates:
+            for pred in predicates:
+                table = (
+                    self._str_prefix_table if pred.kind == 'str_prefix'
+                    else self._dict_type_table
+                )
+                table.setdefault((pred.msg_type, pred.value), []).append((seq, handler))
+        else:
+            self._linear_handlers.append((seq, handler))
+
+        logger.info("Registered handler: %s", handler.__class__.__name__)
         return self
+
+    def _dispatch_candidates(self, message: MCPMessage) -> List:
+        """
+        (seq, handler) pairs that may handle a message, in registration
+        order. One tuple-key table lookup replaces the per-handler
+        can_handle scan; the linear list only holds handlers that did
+        not declare predicates.
+        """
+        content = message.content
+        if isinstance(content, str):
+            indexed = self._str_prefix_table.get(
+                (message.type, content.partition(' ')[0]), ()
+            )
+        elif isinstance(content, dict):
+            indexed = self._dict_type_table.get(
+                (message.type, content.get('type')), ()
+            )
+        else:
+            indexed = ()
+
+        if not self._linear_handlers:
+            return indexed
+        candidates = list(self._linear_handlers)
+        candidates.extend(indexed)
+        candidates.sort(key=lambda pair: pair[0])
+        return candidates
     
     def register_hook(self, event: str, callback: Callable) -> 'MCPProtocol':
         """Register an event hook"""
         if event in self._hooks:
             self._hooks[event].append(callback)
-            logger.debug(f"Registered hook: {event}")
+            logger.debug("Registered hook: %s", event)
         return self
     
     def send(
@@ -174,7 +366,7 @@ class MCPProtocol:
             Created MCPMessage
         """
         # Create message
-        message_id = f"msg_{len(self.context.messages)}_{datetime.now().timestamp()}"
+        message_id = f"{self._id_prefix}{next(self._id_counter)}"
         
         message = MCPMessage(
             id=message_id,
@@ -195,10 +387,52 @@ class MCPProtocol:
         # Execute after_send hooks
         self._execute_hooks('after_send', message, self.context)
         
-        logger.debug(f"Sent message: {message.id} ({message.type.value})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sent message: %s (%s)", message.id, message.type.value)
         
         return message
     
+    def send_batch(self, entries: List[tuple]) -> List[MCPMessage]:
+        """
+        Send several messages in one call.
+        
+        Amortizes per-send overhead against a future networked backend
+        and the in-memory path alike: the whole batch is appended to the
+        context with one deque extend and one timestamp bump instead of
+        per-message bookkeeping. Hooks still fire once per message.
+        
+        Args:
+            entries: (content, role, message_type) tuples
+        
+        Returns:
+            Created MCPMessages, in entry order
+        """
+        prefix = self._id_prefix
+        counter = self._id_counter
+        
+        messages = []
+        for content, role, message_type in entries:
+            message = MCPMessage(
+                id=f"{prefix}{next(counter)}",
+                type=message_type,
+                role=role,
+                content=content,
+                metadata={},
+                context={'session_id': self.session_id}
+            )
+            self._execute_hooks('before_send', message, self.context)
+            messages.append(message)
+        
+        self.context.add_messages(messages)
+        
+        for message in messages:
+            self._execute_hooks('after_send', message, self.context)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sent batch of %d messages", len(messages))
+        
+        return messages
+    
     def receive(self, message: MCPMessage) -> Optional[MCPMessage]:
         """
         Receive and process a message.
@@ -219,9 +453,13 @@ class MCPProtocol:
         
         try:
             # Find and execute handler
-            for handler in self._handlers:
+            for _, handler in self._dispatch_candidates(message):
                 if handler.can_handle(message, self.context):
-                    logger.debug(f"Handler {handler.__class__.__name__} processing message {message.id}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Handler %s processing message %s",
+                            handler.__class__.__name__, message.id
+                        )
                     response = handler.handle(message, self.context)
                     break
             
@@ -229,7 +467,7 @@ class MCPProtocol:
             self._execute_hooks('after_receive', message, self.context)
             
         except Exception as e:
-            logger.error(f"Error processing message {message.id}: {e}")
+            logger.error("Error processing message %s: %s", message.id, e)
             self._execute_hooks('on_error', e, message, self.context)
             
             # Create error response
@@ -307,23 +545,28 @@ class MCPProtocol:
         """Get current context"""
         return self.context
     
-    def get_history(self, limit: Optional[int] = None, role: Optional[MCPRole] = None) -> List[MCPMessage]:
+    def get_history(self, limit: Optional[int] = None, role: Optional[MCPRole] = None) -> Sequence[MCPMessage]:
         """
         Get message history with optional filtering.
-        
+
         Args:
             limit: Maximum number of messages
             role: Filter by role
-        
+
         Returns:
-            List of messages
+            Sequence of messages; full-history reads return an immutable
+            snapshot reused between writes, filtered/limited reads a list
         """
-        messages = self.context.get_history(limit)
-        
         if role:
-            messages = [m for m in messages if m.role == role]
-        
-        return messages
+            # The comprehension already builds a fresh list; no-copy read
+            messages = self.context.get_history(limit)
+            return [m for m in messages if m.role == role]
+
+        if limit:
+            return self.context.get_history(limit, copy=True)
+
+        # Full-history reads share one tuple snapshot per write epoch
+        return self.context.snapshot()
     
     def export_context(self) -> Dict[str, Any]:
         """Export context as dictionary"""
@@ -336,18 +579,41 @@ class MCPProtocol:
             'updated_at': self.context.updated_at.isoformat()
         }
     
+    def export_context_bytes(self) -> bytes:
+        """
+        Export context directly to JSON bytes.
+
+        Uses orjson when available, which serializes the exported dict in
+        C without an intermediate str; datetimes or enums hiding inside
+        message content are handled by the _mcp_default fallback.
+        """
+        data = self.export_context()
+        if orjson:
+            return orjson.dumps(data, default=_mcp_default)
+        return json.dumps(data, default=_mcp_default).encode()
+
+    def import_context_bytes(self, raw: bytes):
+        """Import context from JSON bytes produced by export_context_bytes"""
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+        self.import_context(data)
+
     def import_context(self, data: Dict[str, Any]):
         """Import context from dictionary"""
         self.session_id = data['session_id']
+        created_at = datetime.fromisoformat(data['created_at'])
         self.context = MCPContext(
             session_id=data['session_id'],
             messages=[MCPMessage.from_dict(m) for m in data['messages']],
             variables=data['variables'],
             metadata=data['metadata'],
-            created_at=datetime.fromisoformat(data['created_at']),
-            updated_at=datetime.fromisoformat(data['updated_at'])
+            created_at=created_at
+        )
+        # Re-anchor the monotonic delta so updated_at round-trips
+        updated_at = datetime.fromisoformat(data['updated_at'])
+        self.context._updated_ns = self.context._created_ns + int(
+            (updated_at - created_at).total_seconds() * 1e9
         )
-        logger.info(f"Imported context: {self.session_id}")
+        logger.info("Imported context: %s", self.session_id)
     
     def clear_context(self, keep_variables: bool = False):
         """Clear context"""
@@ -361,7 +627,7 @@ class MCPProtocol:
             try:
                 hook(*args)
             except Exception as e:
-                logger.error(f"Hook error ({event}): {e}")
+                logger.error("Hook error (%s): %s", event, e)
 
 
 # Example handler implementations
@@ -375,6 +641,9 @@ class EchoHandler(MCPHandler):
             isinstance(message.content, str) and
             message.content.startswith('/echo')
         )
+
+    def subscriptions(self) -> List[str]:
+        return ['request:str:/echo']
     
     def handle(self, message: MCPMessage, context: MCPContext) -> MCPMessage:
         content = message.content[6:].strip()  # Remove '/echo '
@@ -399,6 +668,9 @@ class ContextVariableHandler(MCPHandler):
             return message.content.get('type') in ('set_variable', 'get_variable')
         
         return False
+
+    def subscriptions(self) -> List[str]:
+        return ['request:dict:set_variable', 'request:dict:get_variable']
     
     def handle(self, message: MCPMessage, context: MCPContext) -> MCPMessage:
         content = message.content
@@ -4,6 +4,8 @@ SSH module for secure remote connections
 
 from .manager import (
     SSHManager,
+    AsyncSSHManager,
+    SSHBackend,
     SSHConnectionPool,
     SSHCredentials,
     SSHConnection,
@@ -12,6 +14,8 @@ from .manager import (
 
 __all__ = [
     'SSHManager',
+    'AsyncSSHManager',
+    'SSHBackend',
     'SSHConnectionPool',
     'SSHCredentials',
     'SSHConnection',
@@ -3,26 +3,46 @@ SSH Management and Secure Connection System
 Advanced SSH connection pooling, key management, and secure execution.
 """
 
+import asyncio
 import logging
+import select
+import socket
+import subprocess
+import tempfile
 try:
     import paramiko
 except ImportError:
     paramiko = None
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
 from typing import Any, Dict, List, Optional, Tuple, Callable
 from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue, Empty
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class SSHBackend(Enum):
+    """Transport backends for SSHManager"""
+    PARAMIKO = "paramiko"
+    # Multiplex over an OpenSSH ControlMaster socket: after the first
+    # authenticated master, every command/transfer skips the handshake
+    OPENSSH_CONTROLMASTER = "openssh_controlmaster"
+
+
+@dataclass(frozen=True)
 class SSHCredentials:
-    """SSH connection credentials"""
+    """SSH connection credentials (immutable, hashable)"""
     host: str
     port: int = 22
     username: str = ""
@@ -30,6 +50,14 @@ class SSHCredentials:
     key_filename: Optional[str] = None
     passphrase: Optional[str] = None
     timeout: int = 30
+    # Precomputed once; the pool keys every acquire/release on this, so
+    # re-formatting it per call would be pure overhead
+    pool_key: str = field(init=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(
+            self, 'pool_key', f"{self.username}@{self.host}:{self.port}"
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Export as dictionary (masking sensitive data)"""
@@ -43,30 +71,61 @@ class SSHCredentials:
         }
 
 
-@dataclass
+@dataclass(eq=False)
 class SSHConnection:
-    """SSH connection wrapper"""
+    """SSH connection wrapper (identity-based, hashable for pool bookkeeping)"""
     credentials: SSHCredentials
     client: Any  # paramiko.SSHClient
-    created_at: datetime = field(default_factory=datetime.now)
-    last_used: datetime = field(default_factory=datetime.now)
+    # Monotonic floats for age/idle math - a single subtraction per check
+    # instead of a datetime construction; the wall-clock creation time is
+    # captured once for display/export only
+    created_at_mono: float = field(default_factory=time.monotonic)
+    last_used_mono: float = field(default_factory=time.monotonic)
+    created_at_wall: float = field(default_factory=time.time)
     use_count: int = 0
     is_alive: bool = True
+    in_use: bool = False
+    # Concurrent sessions (channels) currently open on this transport;
+    # the pool caps this at its max_sessions
+    active_sessions: int = 0
+    # Cached SFTP session; opening one costs a full subsystem handshake,
+    # which dominates small-file transfer time
+    sftp: Optional[Any] = None
+    
+    def sftp_client(self) -> Any:
+        """
+        Return this connection's SFTP client, opening it on first use.
+        
+        The client is reused across transfers and only reopened when its
+        channel has died; callers must not close it - the pool does that
+        when the connection is retired.
+        """
+        sftp = self.sftp
+        if sftp is not None:
+            channel = sftp.get_channel()
+            if channel is not None and not channel.closed:
+                return sftp
+        sftp = self.sftp = self.client.open_sftp()
+        sftp.get_channel().settimeout(self.credentials.timeout)
+        return sftp
+    
+    @property
+    def created_at(self) -> datetime:
+        """Wall-clock creation time (materialized on demand)"""
+        return datetime.fromtimestamp(self.created_at_wall)
     
     def mark_used(self):
         """Mark connection as used"""
-        self.last_used = datetime.now()
+        self.last_used_mono = time.monotonic()
         self.use_count += 1
     
     def is_expired(self, max_age: int = 3600) -> bool:
         """Check if connection has expired"""
-        age = (datetime.now() - self.created_at).total_seconds()
-        return age > max_age
+        return time.monotonic() - self.created_at_mono > max_age
     
     def is_idle(self, idle_timeout: int = 300) -> bool:
         """Check if connection has been idle too long"""
-        idle = (datetime.now() - self.last_used).total_seconds()
-        return idle > idle_timeout
+        return time.monotonic() - self.last_used_mono > idle_timeout
 
 
 @dataclass
@@ -74,11 +133,33 @@ class SSHExecutionResult:
     """Result of SSH command execution"""
     command: str
     exit_code: int
-    stdout: str
-    stderr: str
+    # Raw channel output; many callers only check success or log bytes,
+    # so UTF-8 decoding is deferred to the stdout/stderr properties and
+    # cached on first access
+    stdout_bytes: bytes
+    stderr_bytes: bytes
     duration: float
     host: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Plain epoch float; formatted to an ISO datetime only in to_dict
+    timestamp: float = field(default_factory=time.time)
+    _stdout_str: Optional[str] = field(default=None, repr=False, compare=False)
+    _stderr_str: Optional[str] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def stdout(self) -> str:
+        """Decoded stdout (lazy, cached; invalid bytes are replaced)"""
+        decoded = self._stdout_str
+        if decoded is None:
+            decoded = self._stdout_str = self.stdout_bytes.decode('utf-8', errors='replace')
+        return decoded
+    
+    @property
+    def stderr(self) -> str:
+        """Decoded stderr (lazy, cached; invalid bytes are replaced)"""
+        decoded = self._stderr_str
+        if decoded is None:
+            decoded = self._stderr_str = self.stderr_bytes.decode('utf-8', errors='replace')
+        return decoded
     
     @property
     def success(self) -> bool:
@@ -95,33 +176,73 @@ class SSHExecutionResult:
             'duration': self.duration,
             'host': self.host,
             'success': self.success,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': datetime.fromtimestamp(self.timestamp).isoformat()
         }
 
 
+@dataclass
+class _HostPool:
+    """Per-host connection bookkeeping: idle connections ready for checkout plus busy ones"""
+    idle: deque = field(default_factory=deque)
+    busy: set = field(default_factory=set)
+    # Handshakes currently in flight; counted against capacity so a cold
+    # start never fires more than max_connections concurrent handshakes
+    creating: int = 0
+    
+    def alive_count(self) -> int:
+        return len(self.idle) + len(self.busy)
+
+
 class SSHConnectionPool:
     """
     Thread-safe SSH connection pool with automatic cleanup.
+    
+    Connections are checked out (moved to a per-host busy set) so two
+    threads never share one transport, and returned to the idle deque by
+    release_connection.
     """
     
+    # Skip the transport.is_active() syscall when the connection was used
+    # this recently - it is almost certainly still alive
+    LIVENESS_RECHECK = 30
+    
     def __init__(
         self,
         max_connections: int = 10,
         max_age: int = 3600,
         idle_timeout: int = 300,
-        cleanup_interval: int = 60
+        cleanup_interval: int = 60,
+        conn_timeout: float = 30.0,
+        max_sessions: int = 1
     ):
         self.max_connections = max_connections
         self.max_age = max_age
         self.idle_timeout = idle_timeout
         self.cleanup_interval = cleanup_interval
+        self.conn_timeout = conn_timeout
+        # With max_sessions > 1, one transport serves several concurrent
+        # exec channels (OpenSSH allows MaxSessions, default 10), so many
+        # short commands share one handshake instead of paying one each.
+        # The default of 1 keeps connections exclusively checked out.
+        self.max_sessions = max_sessions
         
-        self._pools: Dict[str, List[SSHConnection]] = {}
-        self._lock = threading.RLock()
+        # The global lock only guards the key -> (lock, cond, pool) maps;
+        # each host has its own lock so a slow host cannot serialize SSH
+        # work to every other host
+        self._global_lock = threading.Lock()
+        self._pools: Dict[str, _HostPool] = {}
+        self._pool_locks: Dict[str, threading.Lock] = {}
+        # One Condition per pool key, sharing that key's lock: waiters on
+        # a full pool sleep until release/cleanup notifies
+        self._conds: Dict[str, threading.Condition] = {}
         self._cleanup_thread: Optional[threading.Thread] = None
         self._running = False
+        # Server host keys learned on first connect, keyed by (host, port);
+        # pre-installing them on reconnect makes host-key verification a
+        # local lookup instead of a missing-key round through the policy
+        self._host_key_cache: Dict[Tuple[str, int], Any] = {}
         
-        logger.info(f"SSHConnectionPool initialized (max={max_connections})")
+        logger.info("SSHConnectionPool initialized (max=%d)", max_connections)
     
     def start_cleanup(self):
         """Start automatic cleanup thread"""
@@ -149,58 +270,195 @@ class SSHConnectionPool:
         
         Returns:
             SSHConnection instance
+        
+        Raises:
+            TimeoutError: If no connection frees up within conn_timeout
         """
-        with self._lock:
-            pool_key = f"{credentials.username}@{credentials.host}:{credentials.port}"
-            
-            # Get or create pool for this host
-            if pool_key not in self._pools:
-                self._pools[pool_key] = []
-            
-            pool = self._pools[pool_key]
-            
-            # Try to find available connection
-            for conn in pool:
-                if conn.is_alive and not conn.is_expired(self.max_age):
-                    try:
-                        # Test connection
-                        transport = conn.client.get_transport()
-                        if transport and transport.is_active():
-                            conn.mark_used()
-                            logger.debug(f"Reusing SSH connection to {pool_key}")
-                            return conn
-                    except Exception:
-                        conn.is_alive = False
-            
-            # Create new connection if under limit
-            if len([c for c in pool if c.is_alive]) < self.max_connections:
-                conn = self._create_connection(credentials)
-                pool.append(conn)
-                logger.info(f"Created new SSH connection to {pool_key}")
-                return conn
-            
-            # Wait for available connection
-            logger.warning(f"Connection pool full for {pool_key}, waiting...")
-            time.sleep(1)
-            return self.get_connection(credentials)
+        pool_key = credentials.pool_key
+        deadline = time.monotonic() + self.conn_timeout
+        lock, cond, host_pool = self._key_sync(pool_key)
+        to_close: List[SSHConnection] = []
+        
+        try:
+            with lock:
+                while True:
+                    # Pop an idle connection in O(1); validate only that
+                    # one, and only via syscall when it has sat idle a while
+                    while host_pool.idle:
+                        conn = host_pool.idle.popleft()
+                        if not conn.is_alive or conn.is_expired(self.max_age):
+                            to_close.append(conn)
+                            continue
+                        if conn.is_idle(self.LIVENESS_RECHECK):
+                            try:
+                                transport = conn.client.get_transport()
+                                if not (transport and transport.is_active()):
+                                    conn.is_alive = False
+                                    to_close.append(conn)
+                                    continue
+                            except Exception:
+                                conn.is_alive = False
+                                to_close.append(conn)
+                                continue
+                        conn.mark_used()
+                        conn.in_use = True
+                        conn.active_sessions = 1
+                        host_pool.busy.add(conn)
+                        logger.debug("Reusing SSH connection to %s", pool_key)
+                        return conn
+                    
+                    # Multiplex onto a busy transport when allowed: a new
+                    # channel on a live connection skips the TCP+SSH
+                    # handshake entirely
+                    if self.max_sessions > 1:
+                        for conn in host_pool.busy:
+                            if (conn.is_alive
+                                    and conn.active_sessions < self.max_sessions
+                                    and not conn.is_expired(self.max_age)):
+                                conn.mark_used()
+                                conn.active_sessions += 1
+                                logger.debug(
+                                    "Sharing SSH transport to %s (%d sessions)",
+                                    pool_key, conn.active_sessions
+                                )
+                                return conn
+                    
+                    # Claim a creation slot if capacity (including other
+                    # in-flight handshakes) allows; the handshake itself
+                    # runs outside the lock below
+                    if host_pool.alive_count() + host_pool.creating < self.max_connections:
+                        host_pool.creating += 1
+                        break
+                    
+                    # Pool full or enough handshakes already in flight:
+                    # wait for release/creation/cleanup to notify instead
+                    # of the old sleep(1) + recursion, which cost a full
+                    # second per contention event. cond.wait releases only
+                    # this host's lock.
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Timed out waiting for an SSH connection to {pool_key} "
+                            f"after {self.conn_timeout}s"
+                        )
+                    logger.warning("Connection pool full for %s, waiting...", pool_key)
+                    cond.wait(timeout=remaining)
+        finally:
+            # Network closes happen outside the lock so a hung close
+            # cannot freeze other threads on this host
+            for dead in to_close:
+                self._close_quietly(dead)
+        
+        # Perform the TCP + SSH handshake without holding the host lock,
+        # so pooled reuse and releases proceed while we connect
+        try:
+            conn = self._create_connection(credentials)
+        except Exception:
+            with lock:
+                host_pool.creating -= 1
+                # Give a waiter the chance to attempt its own creation
+                cond.notify()
+            raise
+        
+        with lock:
+            host_pool.creating -= 1
+            conn.in_use = True
+            conn.active_sessions = 1
+            host_pool.busy.add(conn)
+        logger.info("Created new SSH connection to %s", pool_key)
+        return conn
+    
+    def _key_sync(self, pool_key: str):
+        """Per-key (lock, condition, host pool), created under the global lock"""
+        with self._global_lock:
+            lock = self._pool_locks.get(pool_key)
+            if lock is None:
+                lock = self._pool_locks[pool_key] = threading.Lock()
+                self._conds[pool_key] = threading.Condition(lock)
+                self._pools[pool_key] = _HostPool()
+            return lock, self._conds[pool_key], self._pools[pool_key]
     
     def release_connection(self, connection: SSHConnection):
-        """Release connection back to pool"""
-        # Connection remains in pool for reuse
-        logger.debug(f"Released SSH connection to {connection.credentials.host}")
+        """Return a checked-out connection to the idle pool and wake one waiter"""
+        creds = connection.credentials
+        lock, cond, host_pool = self._key_sync(creds.pool_key)
+        dead = None
+        with lock:
+            if connection in host_pool.busy:
+                connection.active_sessions -= 1
+                if connection.active_sessions <= 0:
+                    connection.active_sessions = 0
+                    host_pool.busy.discard(connection)
+                    connection.in_use = False
+                    if connection.is_alive:
+                        host_pool.idle.append(connection)
+                    else:
+                        dead = connection
+            cond.notify()
+        if dead is not None:
+            self._close_quietly(dead)
+        logger.debug("Released SSH connection to %s", creds.host)
+    
+    @staticmethod
+    def _close_quietly(connection: SSHConnection):
+        """Close a connection's SFTP session and client, swallowing transport errors"""
+        if connection.sftp is not None:
+            try:
+                connection.sftp.close()
+            except Exception:
+                pass
+            connection.sftp = None
+        try:
+            connection.client.close()
+        except Exception:
+            pass
     
     def close_all(self):
         """Close all connections"""
-        with self._lock:
-            for pool in self._pools.values():
-                for conn in pool:
-                    try:
-                        conn.client.close()
-                    except Exception as e:
-                        logger.error(f"Error closing connection: {e}")
-            
-            self._pools.clear()
-            logger.info("All SSH connections closed")
+        with self._global_lock:
+            pool_keys = list(self._pools)
+        
+        to_close: List[SSHConnection] = []
+        for pool_key in pool_keys:
+            lock, cond, host_pool = self._key_sync(pool_key)
+            with lock:
+                to_close.extend(host_pool.idle)
+                to_close.extend(host_pool.busy)
+                host_pool.idle.clear()
+                host_pool.busy.clear()
+                cond.notify_all()
+        
+        for conn in to_close:
+            try:
+                self._close_quietly(conn)
+            except Exception as e:
+                logger.error("Error closing connection: %s", e)
+        logger.info("All SSH connections closed")
+    
+    @staticmethod
+    def _open_socket(credentials: SSHCredentials) -> socket.socket:
+        """
+        Open a tuned TCP socket for the SSH handshake.
+        
+        TCP_NODELAY is set before the handshake - Nagle's algorithm
+        delays the small handshake packets and adds whole round-trips
+        to session establishment. The 32 MB send/receive buffers let
+        SFTP transfers fill high bandwidth-delay-product links.
+        create_connection resolves the host via getaddrinfo, so IPv6 and
+        dual-stack targets work exactly as paramiko's own connect did.
+        """
+        sock = socket.create_connection(
+            (credentials.host, credentials.port),
+            timeout=credentials.timeout
+        )
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 32 << 20)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 32 << 20)
+        except Exception:
+            sock.close()
+            raise
+        return sock
     
     def _create_connection(self, credentials: SSHCredentials) -> SSHConnection:
         """Create a new SSH connection"""
@@ -210,12 +468,23 @@ class SSHConnectionPool:
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         
+        # Seed the client with the host key from a previous connection to
+        # this target, if we have one
+        cached_key = self._host_key_cache.get((credentials.host, credentials.port))
+        if cached_key is not None:
+            hostname = (
+                credentials.host if credentials.port == 22
+                else f"[{credentials.host}]:{credentials.port}"
+            )
+            client.get_host_keys().add(hostname, cached_key.get_name(), cached_key)
+        
         try:
             connect_kwargs = {
                 'hostname': credentials.host,
                 'port': credentials.port,
                 'username': credentials.username,
-                'timeout': credentials.timeout
+                'timeout': credentials.timeout,
+                'sock': self._open_socket(credentials)
             }
             
             if credentials.key_filename:
@@ -227,13 +496,23 @@ class SSHConnectionPool:
             
             client.connect(**connect_kwargs)
             
+            # Keepalives stop NAT/firewall state from silently dropping
+            # idle pooled connections
+            transport = client.get_transport()
+            if transport:
+                transport.set_keepalive(30)
+                if cached_key is None:
+                    self._host_key_cache[(credentials.host, credentials.port)] = (
+                        transport.get_remote_server_key()
+                    )
+            
             return SSHConnection(
                 credentials=credentials,
                 client=client
             )
         
         except Exception as e:
-            logger.error(f"Failed to create SSH connection to {credentials.host}: {e}")
+            logger.error("Failed to create SSH connection to %s: %s", credentials.host, e)
             raise
     
     def _cleanup_worker(self):
@@ -243,29 +522,37 @@ class SSHConnectionPool:
                 time.sleep(self.cleanup_interval)
                 self._cleanup_expired()
             except Exception as e:
-                logger.error(f"Cleanup worker error: {e}")
+                logger.error("Cleanup worker error: %s", e)
     
     def _cleanup_expired(self):
-        """Remove expired and idle connections"""
-        with self._lock:
-            for pool_key, pool in list(self._pools.items()):
-                cleaned = []
-                
-                for conn in pool:
+        """Remove expired and idle connections (busy ones are left alone)"""
+        with self._global_lock:
+            pool_keys = list(self._pools)
+        
+        for pool_key in pool_keys:
+            lock, cond, host_pool = self._key_sync(pool_key)
+            to_close: List[SSHConnection] = []
+            
+            # One host's lock at a time, and only for the bookkeeping -
+            # the actual closes happen after the lock is dropped
+            with lock:
+                idle = host_pool.idle
+                # Rotate in place: survivors cycle back to the right, so
+                # the common nothing-expired tick allocates no new deque
+                for _ in range(len(idle)):
+                    conn = idle.popleft()
                     if conn.is_expired(self.max_age) or conn.is_idle(self.idle_timeout):
-                        try:
-                            conn.client.close()
-                            logger.debug(f"Cleaned up expired connection to {pool_key}")
-                        except Exception:
-                            pass
+                        to_close.append(conn)
+                        logger.debug("Cleaned up expired connection to %s", pool_key)
                     else:
-                        cleaned.append(conn)
+                        idle.append(conn)
                 
-                self._pools[pool_key] = cleaned
-                
-                # Remove empty pools
-                if not cleaned:
-                    del self._pools[pool_key]
+                # Capacity may have freed up; wake any waiters
+                if to_close:
+                    cond.notify_all()
+            
+            for conn in to_close:
+                self._close_quietly(conn)
 
 
 class SSHManager:
@@ -284,17 +571,124 @@ class SSHManager:
     def __init__(
         self,
         connection_pool: Optional[SSHConnectionPool] = None,
-        default_credentials: Optional[SSHCredentials] = None
+        default_credentials: Optional[SSHCredentials] = None,
+        backend: SSHBackend = SSHBackend.PARAMIKO
     ):
         self.pool = connection_pool or SSHConnectionPool()
         self.default_credentials = default_credentials
+        self.backend = backend
         self._lock = threading.RLock()
+        # Targets with an established ControlMaster, by pool key
+        self._masters: set = set()
         
         logger.info("SSHManager initialized")
         
         # Start connection pool cleanup
         self.pool.start_cleanup()
     
+    @staticmethod
+    def _control_path() -> str:
+        """ControlPath pattern; OpenSSH expands %r/%h/%p per target"""
+        return str(Path(tempfile.gettempdir()) / 'wiredup-%r@%h:%p')
+    
+    def _ensure_master(self, creds: SSHCredentials):
+        """Establish the ControlMaster for a target once per manager"""
+        key = creds.pool_key
+        with self._lock:
+            if key in self._masters:
+                return
+            self._masters.add(key)
+        
+        cmd = [
+            'ssh', '-M', '-N', '-f',
+            '-o', 'ControlMaster=auto',
+            '-o', f'ControlPath={self._control_path()}',
+            '-o', 'ControlPersist=600',
+            '-o', 'BatchMode=yes',
+        ]
+        if creds.key_filename:
+            cmd += ['-i', creds.key_filename]
+        cmd += ['-p', str(creds.port), f'{creds.username}@{creds.host}']
+        
+        try:
+            subprocess.run(cmd, capture_output=True, timeout=creds.timeout, check=True)
+            logger.info("Established SSH ControlMaster for %s", key)
+        except Exception:
+            with self._lock:
+                self._masters.discard(key)
+            raise
+    
+    def _execute_openssh(
+        self,
+        command: str,
+        creds: SSHCredentials,
+        timeout: int,
+        raise_on_error: bool
+    ) -> SSHExecutionResult:
+        """Run a command over the multiplexed OpenSSH master connection"""
+        start_time = time.monotonic()
+
+        try:
+            self._ensure_master(creds)
+            proc = subprocess.run(
+                [
+                    'ssh',
+                    '-o', f'ControlPath={self._control_path()}',
+                    '-p', str(creds.port),
+                    f'{creds.username}@{creds.host}',
+                    command,
+                ],
+                capture_output=True,
+                timeout=timeout
+            )
+        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, OSError) as e:
+            # Match the paramiko branch's error contract: failures
+            # surface as an exit_code=-1 result unless raise_on_error
+            logger.error("OpenSSH execution failed: %s", e)
+            if raise_on_error:
+                raise
+            return SSHExecutionResult(
+                command=command,
+                exit_code=-1,
+                stdout_bytes=b"",
+                stderr_bytes=str(e).encode(),
+                duration=time.monotonic() - start_time,
+                host=creds.host
+            )
+
+        result = SSHExecutionResult(
+            command=command,
+            exit_code=proc.returncode,
+            stdout_bytes=proc.stdout,
+            stderr_bytes=proc.stderr,
+            duration=time.monotonic() - start_time,
+            host=creds.host
+        )
+        
+        if not result.success and raise_on_error:
+            raise RuntimeError(
+                f"Command failed with exit code {result.exit_code}: {result.stderr}"
+            )
+        
+        return result
+    
+    def _scp_transfer(self, source: str, dest: str, creds: SSHCredentials) -> bool:
+        """Copy a file with scp over the multiplexed master connection"""
+        self._ensure_master(creds)
+        proc = subprocess.run(
+            [
+                'scp',
+                '-o', f'ControlPath={self._control_path()}',
+                '-P', str(creds.port),
+                source,
+                dest,
+            ],
+            capture_output=True
+        )
+        if proc.returncode != 0:
+            logger.error("scp failed: %s", proc.stderr.decode('utf-8', errors='replace'))
+        return proc.returncode == 0
+    
     def execute(
         self,
         command: str,
@@ -320,6 +714,9 @@ class SSHManager:
         if not creds:
             raise ValueError("No SSH credentials provided")
         
+        if self.backend is SSHBackend.OPENSSH_CONTROLMASTER:
+            return self._execute_openssh(command, creds, timeout, raise_on_error)
+        
         attempt = 0
         last_error = None
         
@@ -329,37 +726,47 @@ class SSHManager:
                 
                 # Get connection from pool
                 connection = self.pool.get_connection(creds)
-                
-                # Execute command
-                stdin, stdout, stderr = connection.client.exec_command(
-                    command,
-                    timeout=timeout
-                )
-                
-                # Wait for completion
-                exit_code = stdout.channel.recv_exit_status()
-                stdout_data = stdout.read().decode('utf-8')
-                stderr_data = stderr.read().decode('utf-8')
-                
+
+                try:
+                    # Execute command
+                    stdin, stdout, stderr = connection.client.exec_command(
+                        command,
+                        timeout=timeout
+                    )
+
+                    # Drain both streams as data arrives, then take the exit
+                    # status - see _drain_channel for why
+                    exit_code, stdout_bytes, stderr_bytes = self._drain_channel(stdout.channel)
+                except Exception:
+                    # Channel state is unknown after a failed or timed-out
+                    # command; drop the transport rather than re-pool it
+                    connection.is_alive = False
+                    raise
+                finally:
+                    # Always check the connection back in - a dead one is
+                    # closed by release_connection instead of re-pooled
+                    self.pool.release_connection(connection)
+
                 duration = time.time() - start_time
-                
-                # Release connection
-                self.pool.release_connection(connection)
-                
+
                 # Create result
                 result = SSHExecutionResult(
                     command=command,
                     exit_code=exit_code,
-                    stdout=stdout_data,
-                    stderr=stderr_data,
+                    stdout_bytes=stdout_bytes,
+                    stderr_bytes=stderr_bytes,
                     duration=duration,
                     host=creds.host
                 )
                 
-                logger.info(f"SSH command executed on {creds.host}: {command} (exit={exit_code})")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "SSH command executed on %s: %s (exit=%d)",
+                        creds.host, command[:200], exit_code
+                    )
                 
                 if not result.success and raise_on_error:
-                    raise RuntimeError(f"Command failed with exit code {exit_code}: {stderr_data}")
+                    raise RuntimeError(f"Command failed with exit code {exit_code}: {result.stderr}")
                 
                 return result
             
@@ -368,22 +775,63 @@ class SSHManager:
                 attempt += 1
                 
                 if attempt <= retries:
-                    logger.warning(f"SSH execution failed (attempt {attempt}/{retries + 1}): {e}")
+                    logger.warning("SSH execution failed (attempt %d/%d): %s", attempt, retries + 1, e)
                     time.sleep(1)
                 else:
-                    logger.error(f"SSH execution failed after {retries + 1} attempts: {e}")
+                    logger.error("SSH execution failed after %d attempts: %s", retries + 1, e)
                     if raise_on_error:
                         raise
                     
                     return SSHExecutionResult(
                         command=command,
                         exit_code=-1,
-                        stdout="",
-                        stderr=str(last_error),
+                        stdout_bytes=b"",
+                        stderr_bytes=str(last_error).encode(),
                         duration=0,
                         host=creds.host
                     )
     
+    @staticmethod
+    def _drain_channel(channel) -> Tuple[int, bytes, bytes]:
+        """
+        Drain a paramiko channel's stdout/stderr in a single pass.
+        
+        Calling recv_exit_status() before reading blocks until the
+        channel closes and can deadlock when stderr fills its window;
+        it also serializes the two stream drains. This loop pulls from
+        whichever stream has data, parks in select() when neither does,
+        and only reads the exit status once both streams hit EOF.
+        
+        Returns:
+            (exit_code, stdout_bytes, stderr_bytes)
+        """
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        
+        while True:
+            drained = False
+            while channel.recv_ready():
+                stdout_buf += channel.recv(65536)
+                drained = True
+            while channel.recv_stderr_ready():
+                stderr_buf += channel.recv_stderr(65536)
+                drained = True
+            
+            if channel.exit_status_ready() and not drained:
+                break
+            if not drained:
+                # Short timeout so exit_status_ready is still polled even
+                # if the server closes without a final data burst
+                select.select([channel], [], [], 0.1)
+        
+        # Final drain: data may race the exit status
+        while channel.recv_ready():
+            stdout_buf += channel.recv(65536)
+        while channel.recv_stderr_ready():
+            stderr_buf += channel.recv_stderr(65536)
+        
+        return channel.recv_exit_status(), bytes(stdout_buf), bytes(stderr_buf)
+    
     def execute_batch(
         self,
         commands: List[str],
@@ -399,41 +847,40 @@ class SSHManager:
             parallel: Execute in parallel
         
         Returns:
-            List of SSHExecutionResult
+            List of SSHExecutionResult, in the same order as commands
         """
-        if parallel:
-            results = []
-            threads = []
-            
-            def worker(cmd):
-                result = self.execute(cmd, credentials)
-                results.append(result)
-            
-            for cmd in commands:
-                thread = threading.Thread(target=worker, args=(cmd,))
-                thread.start()
-                threads.append(thread)
-            
-            for thread in threads:
-                thread.join()
-            
-            return results
-        else:
-            return [self.execute(cmd, credentials) for cmd in commands]
+        if parallel and len(commands) > 1:
+            # Workers are capped at the pool size: threads beyond that
+            # would only queue up behind get_connection anyway, and the
+            # bound keeps concurrent new handshakes under the typical
+            # OpenSSH MaxStartups limit. executor.map preserves order.
+            max_workers = min(len(commands), self.pool.max_connections)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(
+                    lambda cmd: self.execute(cmd, credentials), commands
+                ))
+        return [self.execute(cmd, credentials) for cmd in commands]
     
     def upload_file(
         self,
         local_path: Path,
         remote_path: str,
-        credentials: Optional[SSHCredentials] = None
+        credentials: Optional[SSHCredentials] = None,
+        block_size: int = 1 << 20
     ) -> bool:
         """
         Upload file via SFTP.
         
+        Writes are pipelined: without set_pipelined every 32 KB SFTP
+        block waits for a server ack, capping throughput at roughly one
+        block per round-trip. Pipelining overlaps the acks and is the
+        difference between KB/s and MB/s on high-latency links.
+        
         Args:
             local_path: Local file path
             remote_path: Remote file path
             credentials: SSH credentials
+            block_size: Local read chunk size in bytes
         
         Returns:
             True if successful
@@ -442,35 +889,56 @@ class SSHManager:
         if not creds:
             raise ValueError("No SSH credentials provided")
         
+        if self.backend is SSHBackend.OPENSSH_CONTROLMASTER:
+            return self._scp_transfer(
+                str(local_path), f"{creds.username}@{creds.host}:{remote_path}", creds
+            )
+        
         try:
             connection = self.pool.get_connection(creds)
-            sftp = connection.client.open_sftp()
-            
-            sftp.put(str(local_path), remote_path)
-            sftp.close()
-            
-            self.pool.release_connection(connection)
-            
-            logger.info(f"Uploaded file to {creds.host}:{remote_path}")
+            try:
+                sftp = connection.sftp_client()
+
+                with open(local_path, 'rb') as local_file, \
+                        sftp.open(remote_path, 'wb') as remote_file:
+                    remote_file.set_pipelined(True)
+                    while chunk := local_file.read(block_size):
+                        remote_file.write(chunk)
+            except Exception:
+                connection.is_alive = False
+                raise
+            finally:
+                self.pool.release_connection(connection)
+
+            logger.info("Uploaded file to %s:%s", creds.host, remote_path)
             return True
-        
+
         except Exception as e:
-            logger.error(f"Failed to upload file: {e}")
+            logger.error("Failed to upload file: %s", e)
             return False
     
     def download_file(
         self,
         remote_path: str,
         local_path: Path,
-        credentials: Optional[SSHCredentials] = None
+        credentials: Optional[SSHCredentials] = None,
+        block_size: int = 1 << 20,
+        max_concurrent_prefetch_requests: Optional[int] = None
     ) -> bool:
         """
         Download file via SFTP.
         
+        The remote file is prefetched before reading, so outstanding
+        read requests overlap in flight instead of one block per
+        round-trip (the read-side analog of write pipelining).
+        
         Args:
             remote_path: Remote file path
             local_path: Local file path
             credentials: SSH credentials
+            block_size: Read chunk size in bytes
+            max_concurrent_prefetch_requests: Cap on in-flight prefetch
+                reads (None lets paramiko saturate the window)
         
         Returns:
             True if successful
@@ -479,24 +947,212 @@ class SSHManager:
         if not creds:
             raise ValueError("No SSH credentials provided")
         
+        if self.backend is SSHBackend.OPENSSH_CONTROLMASTER:
+            return self._scp_transfer(
+                f"{creds.username}@{creds.host}:{remote_path}", str(local_path), creds
+            )
+        
         try:
             connection = self.pool.get_connection(creds)
-            sftp = connection.client.open_sftp()
-            
-            sftp.get(remote_path, str(local_path))
-            sftp.close()
-            
-            self.pool.release_connection(connection)
-            
-            logger.info(f"Downloaded file from {creds.host}:{remote_path}")
+            try:
+                sftp = connection.sftp_client()
+
+                with sftp.open(remote_path, 'rb') as remote_file, \
+                        open(local_path, 'wb') as local_file:
+                    file_size = remote_file.stat().st_size
+                    remote_file.prefetch(file_size, max_concurrent_prefetch_requests)
+                    while chunk := remote_file.read(block_size):
+                        local_file.write(chunk)
+            except Exception:
+                connection.is_alive = False
+                raise
+            finally:
+                self.pool.release_connection(connection)
+
+            logger.info("Downloaded file from %s:%s", creds.host, remote_path)
             return True
-        
+
         except Exception as e:
-            logger.error(f"Failed to download file: {e}")
+            logger.error("Failed to download file: %s", e)
             return False
     
     def close(self):
-        """Close all connections"""
+        """Close all connections (and any ControlMaster sockets)"""
         self.pool.stop_cleanup()
         self.pool.close_all()
+        
+        with self._lock:
+            masters = list(self._masters)
+            self._masters.clear()
+        for key in masters:
+            target, _, port = key.rpartition(':')
+            try:
+                subprocess.run(
+                    [
+                        'ssh', '-O', 'exit',
+                        '-o', f'ControlPath={self._control_path()}',
+                        '-p', port,
+                        target,
+                    ],
+                    capture_output=True,
+                    timeout=10
+                )
+            except Exception as e:
+                logger.warning("Failed to stop ControlMaster for %s: %s", key, e)
+        
         logger.info("SSHManager closed")
+
+
+class AsyncSSHManager:
+    """
+    Asyncio-based SSH manager backed by asyncssh (optional dependency).
+    
+    Threaded paramiko fan-out pays one OS thread plus a GIL switch per
+    network wakeup for every in-flight command, and paramiko's SFTP is
+    not thread-safe. asyncssh multiplexes all channels on one event
+    loop, so execute_batch scales to hundreds of hosts with a single
+    thread. One connection is kept per target and reused across calls.
+    """
+    
+    def __init__(self, default_credentials: Optional[SSHCredentials] = None):
+        if asyncssh is None:
+            raise ImportError(
+                "asyncssh is not installed. Please install it to use async SSH features."
+            )
+        
+        self.default_credentials = default_credentials
+        self._connections: Dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+        
+        logger.info("AsyncSSHManager initialized")
+    
+    async def _get_connection(self, creds: SSHCredentials) -> Any:
+        """Get or open the shared connection for a target"""
+        async with self._lock:
+            conn = self._connections.get(creds.pool_key)
+            if conn is not None:
+                return conn
+            
+            connect_kwargs: Dict[str, Any] = {
+                'host': creds.host,
+                'port': creds.port,
+                'username': creds.username,
+                'known_hosts': None
+            }
+            if creds.key_filename:
+                connect_kwargs['client_keys'] = [creds.key_filename]
+                if creds.passphrase:
+                    connect_kwargs['passphrase'] = creds.passphrase
+            elif creds.password:
+                connect_kwargs['password'] = creds.password
+            
+            conn = await asyncio.wait_for(
+                asyncssh.connect(**connect_kwargs), creds.timeout
+            )
+            self._connections[creds.pool_key] = conn
+            logger.info("Created async SSH connection to %s", creds.pool_key)
+            return conn
+    
+    async def execute(
+        self,
+        command: str,
+        credentials: Optional[SSHCredentials] = None,
+        timeout: int = 30,
+        raise_on_error: bool = False
+    ) -> SSHExecutionResult:
+        """
+        Execute a command via SSH.
+        
+        Args:
+            command: Command to execute
+            credentials: SSH credentials (uses default if not provided)
+            timeout: Command timeout in seconds
+            raise_on_error: Raise exception on non-zero exit code
+        
+        Returns:
+            SSHExecutionResult
+        """
+        creds = credentials or self.default_credentials
+        if not creds:
+            raise ValueError("No SSH credentials provided")
+        
+        start_time = time.monotonic()
+        
+        try:
+            conn = await self._get_connection(creds)
+            proc = await conn.run(command, timeout=timeout, check=False)
+        except Exception as e:
+            # Drop the cached connection so the next call redials,
+            # closing it first so the socket and its tasks are freed
+            stale = self._connections.pop(creds.pool_key, None)
+            if stale is not None:
+                try:
+                    stale.close()
+                    await stale.wait_closed()
+                except Exception:
+                    pass
+            logger.error("Async SSH execution failed: %s", e)
+            if raise_on_error:
+                raise
+            return SSHExecutionResult(
+                command=command,
+                exit_code=-1,
+                stdout_bytes=b"",
+                stderr_bytes=str(e).encode(),
+                duration=time.monotonic() - start_time,
+                host=creds.host
+            )
+        
+        exit_code = proc.exit_status if proc.exit_status is not None else -1
+        # asyncssh hands back decoded str; normalize to the bytes fields
+        stdout = proc.stdout or ""
+        stderr = proc.stderr or ""
+        result = SSHExecutionResult(
+            command=command,
+            exit_code=exit_code,
+            stdout_bytes=stdout if isinstance(stdout, bytes) else stdout.encode(),
+            stderr_bytes=stderr if isinstance(stderr, bytes) else stderr.encode(),
+            duration=time.monotonic() - start_time,
+            host=creds.host
+        )
+        
+        if not result.success and raise_on_error:
+            raise RuntimeError(
+                f"Command failed with exit code {exit_code}: {result.stderr}"
+            )
+        
+        return result
+    
+    async def execute_batch(
+        self,
+        commands: List[str],
+        credentials: Optional[SSHCredentials] = None
+    ) -> List[SSHExecutionResult]:
+        """
+        Execute multiple commands concurrently.
+        
+        All commands are in flight at once as channels multiplexed over
+        the shared connection - no per-command thread.
+        
+        Args:
+            commands: List of commands to execute
+            credentials: SSH credentials
+        
+        Returns:
+            List of SSHExecutionResult, in the same order as commands
+        """
+        return list(await asyncio.gather(
+            *(self.execute(cmd, credentials) for cmd in commands)
+        ))
+    
+    async def close(self):
+        """Close all connections"""
+        async with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        
+        for conn in connections:
+            conn.close()
+            await conn.wait_closed()
+        
+        logger.info("AsyncSSHManager closed")
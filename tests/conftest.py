@@ -0,0 +1,82 @@
+"""
+Shared pytest fixtures for the test suite.
+
+The tests are safe to distribute with pytest-xdist (``pytest -n auto``):
+each test builds its own AutoWire/EnvManager/MCPProtocol instances and
+no module holds shared mutable state across tests.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+# Prefer uvloop's libuv-backed event loop for the async tests when it is
+# installed; the selector loop is the silent fallback elsewhere
+if sys.platform != 'win32':
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+from src.agents.base_agent import AgentContext
+from src.core.autowire import AutoWire
+
+# One engine shared by every test that requests the autowire fixture;
+# per-test isolation comes from AutoWire.scope(), not reconstruction
+_shared_engine = AutoWire()
+
+# Single context reused by the agent_context fixture; isolation comes
+# from the per-test teardown clear()s, not reconstruction
+_shared_context = AgentContext(session_id='shared_test_session')
+
+
+@pytest.fixture
+def agent_context():
+    """
+    Provide a reusable agent execution context.
+
+    The same context object (and its backing state/metadata dicts) is
+    reused across tests instead of allocating a fresh AgentContext per
+    test; teardown clears the mutable stores and restores the session
+    id so no state leaks between tests. Tests that need a specific
+    session id overwrite ``ctx.session_id`` directly.
+    """
+    ctx = _shared_context
+    yield ctx
+    ctx.state.clear()
+    ctx.metadata.clear()
+    ctx.session_id = 'shared_test_session'
+    ctx.user_id = None
+
+
+@pytest.fixture
+def autowire():
+    """
+    Provide a shared AutoWire engine with per-test registration scope.
+
+    Registrations made inside a test are rolled back by
+    AutoWire.scope() on teardown, so tests get isolation without paying
+    container construction per test.
+    """
+    with _shared_engine.scope():
+        yield _shared_engine
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """
+    Turn every asyncio.sleep into a zero-delay yield for one test.
+
+    Opt-in: tests that exercise timing-sensitive code (timeouts,
+    backoff) should not request it. The patched sleep still yields to
+    the event loop once, so task-switching behavior is preserved while
+    wall-clock delays disappear.
+    """
+    real_sleep = asyncio.sleep
+
+    async def _instant_sleep(delay, result=None):
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr(asyncio, 'sleep', _instant_sleep)
@@ -151,10 +151,25 @@ class TestMCPProtocol:
         
         mcp.send("Message 1", role=MCPRole.USER)
         mcp.send("Message 2", role=MCPRole.ASSISTANT)
-        
+
         history = mcp.get_history()
         assert len(history) == 2
     
+    def test_send_batch(self):
+        """Test batched sending"""
+        mcp = MCPProtocol()
+        
+        messages = mcp.send_batch([
+            ("First", MCPRole.USER, MCPMessageType.REQUEST),
+            ("Second", MCPRole.ASSISTANT, MCPMessageType.RESPONSE),
+            ("Third", MCPRole.USER, MCPMessageType.NOTIFICATION),
+        ])
+        
+        assert [m.content for m in messages] == ["First", "Second", "Third"]
+        assert len({m.id for m in messages}) == 3
+        assert messages[2].type == MCPMessageType.NOTIFICATION
+        assert len(mcp.get_history()) == 3
+    
     def test_context_export_import(self):
         """Test context export and import"""
         mcp1 = MCPProtocol(session_id="test_session")
@@ -174,7 +189,6 @@ class TestMCPProtocol:
 class TestBaseAgent:
     """Tests for Base Agent"""
     
-    @pytest.mark.asyncio
     async def test_agent_creation(self):
         """Test agent creation"""
         
@@ -186,7 +200,6 @@ class TestBaseAgent:
         assert agent.name == 'test_agent'
         assert agent.get_config('version') == '1.0'
     
-    @pytest.mark.asyncio
     async def test_skill_management(self):
         """Test skill management"""
         
@@ -213,7 +226,6 @@ class TestBaseAgent:
 class TestIntegration:
     """Integration tests"""
     
-    @pytest.mark.asyncio
     async def test_full_stack_integration(self):
         """Test full stack integration"""
         
@@ -6,6 +6,7 @@ Tests real-world scenarios and end-to-end workflows for the AI Auto-Wiring Syste
 import pytest
 import asyncio
 import logging
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -20,70 +21,108 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Key sets for one-shot subset assertions over result dicts
+_RESEARCH_RESULT_KEYS = frozenset({'success', 'agent', 'task', 'findings', 'sources'})
+_ANALYSIS_RESULT_KEYS = frozenset({'success', 'agent', 'task', 'analysis', 'analysis_number'})
+
+
+async def _fanout(coros: List) -> List[Any]:
+    """
+    Await independent coroutines concurrently, preserving input order.
+
+    Uses asyncio.TaskGroup on Python 3.11+ so one failure cancels the
+    remaining sub-tasks; falls back to asyncio.gather elsewhere.
+    """
+    if hasattr(asyncio, 'TaskGroup'):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+        return [task.result() for task in tasks]
+    return list(await asyncio.gather(*coros))
+
+
 class ResearchAgent(BaseAgent):
     """Agent for research tasks"""
-    
+
+    # Static parts of the per-run result, built once and copied per call
+    _RESULT_TEMPLATE = {
+        'success': True,
+        'sources': ['source1', 'source2', 'source3']
+    }
+
     def __init__(self, name: str, config: Dict[str, Any] = None):
         super().__init__(name, config)
-        self.research_results = []
-    
+        # Structure-of-arrays bookkeeping: parallel per-run lists instead
+        # of one nested result dict per run
+        self._tasks: List[str] = []
+        self._findings: List[List[str]] = []
+        self._sources: List[List[str]] = []
+
+    @property
+    def research_results(self) -> List[Dict[str, Any]]:
+        """Per-run results reassembled from the parallel lists"""
+        return [
+            {'task': task, 'findings': findings, 'sources': sources}
+            for task, findings, sources in zip(
+                self._tasks, self._findings, self._sources
+            )
+        ]
+
     async def execute(self, task: str, context: AgentContext) -> Dict[str, Any]:
         """Execute research task"""
-        self.log_info(f"Starting research: {task}")
-        
-        # Simulate research
-        await asyncio.sleep(0.1)
-        
-        result = {
-            'success': True,
-            'agent': self.name,
-            'task': task,
-            'findings': [
-                f"Finding 1 for: {task}",
-                f"Finding 2 for: {task}",
-                f"Finding 3 for: {task}"
-            ],
-            'sources': ['source1', 'source2', 'source3']
-        }
-        
-        self.research_results.append(result)
-        self.log_info(f"Research completed: {task}")
-        
+        self.log_info("Starting research: %s", task)
+
+        # Yield to the event loop without a real-time delay
+        await asyncio.sleep(0)
+
+        findings = [f"Finding {i} for: {task}" for i in (1, 2, 3)]
+        result = self._RESULT_TEMPLATE.copy()
+        result['agent'] = self.name
+        result['task'] = task
+        result['findings'] = findings
+
+        self._tasks.append(task)
+        self._findings.append(findings)
+        self._sources.append(result['sources'])
+        self.log_info("Research completed: %s", task)
+
         return result
 
 
 class AnalysisAgent(BaseAgent):
     """Agent for data analysis"""
-    
+
+    # Static parts of the per-run result, built once and copied per call
+    _RESULT_TEMPLATE = {
+        'success': True,
+        'analysis': {
+            'patterns_found': 5,
+            'confidence': 0.95,
+            'insights': [
+                'Insight 1',
+                'Insight 2',
+                'Insight 3'
+            ]
+        }
+    }
+
     def __init__(self, name: str, config: Dict[str, Any] = None):
         super().__init__(name, config)
         self.analysis_count = 0
     
     async def execute(self, task: str, context: AgentContext) -> Dict[str, Any]:
         """Execute analysis task"""
-        self.log_info(f"Starting analysis: {task}")
+        self.log_info("Starting analysis: %s", task)
         
-        # Simulate analysis
-        await asyncio.sleep(0.1)
+        # Yield to the event loop without a real-time delay
+        await asyncio.sleep(0)
         self.analysis_count += 1
         
-        result = {
-            'success': True,
-            'agent': self.name,
-            'task': task,
-            'analysis': {
-                'patterns_found': 5,
-                'confidence': 0.95,
-                'insights': [
-                    'Insight 1',
-                    'Insight 2',
-                    'Insight 3'
-                ]
-            },
-            'analysis_number': self.analysis_count
-        }
+        result = self._RESULT_TEMPLATE.copy()
+        result['agent'] = self.name
+        result['task'] = task
+        result['analysis_number'] = self.analysis_count
         
-        self.log_info(f"Analysis completed: {task}")
+        self.log_info("Analysis completed: %s", task)
         
         return result
 
@@ -98,17 +137,16 @@ class CoordinatorAgent(BaseAgent):
     def add_sub_agent(self, agent: BaseAgent):
         """Add a sub-agent"""
         self.sub_agents.append(agent)
-        self.log_info(f"Added sub-agent: {agent.name}")
+        self.log_info("Added sub-agent: %s", agent.name)
     
     async def execute(self, task: str, context: AgentContext) -> Dict[str, Any]:
         """Execute coordinated task"""
-        self.log_info(f"Coordinating task: {task}")
+        self.log_info("Coordinating task: %s", task)
         
-        # Execute on all sub-agents
-        results = []
-        for agent in self.sub_agents:
-            result = await agent.execute(task, context)
-            results.append(result)
+        # Execute all sub-agents concurrently; _fanout preserves ordering
+        results = await _fanout(
+            [agent.execute(task, context) for agent in self.sub_agents]
+        )
         
         coordinated_result = {
             'success': True,
@@ -118,7 +156,7 @@ class CoordinatorAgent(BaseAgent):
             'summary': f"Coordinated {len(results)} sub-agents"
         }
         
-        self.log_info(f"Coordination completed: {task}")
+        self.log_info("Coordination completed: %s", task)
         
         return coordinated_result
 
@@ -126,8 +164,7 @@ class CoordinatorAgent(BaseAgent):
 class TestUserJourneyBasic:
     """Test basic user journeys"""
     
-    @pytest.mark.asyncio
-    async def test_journey_single_agent_workflow(self):
+    async def test_journey_single_agent_workflow(self, autowire):
         """
         User Journey: Developer creates and uses a single agent
         
@@ -138,9 +175,8 @@ class TestUserJourneyBasic:
         4. Execute a task
         5. Verify results
         """
-        # Step 1: Initialize auto-wiring
-        autowire = AutoWire()
-        
+        # Step 1: Auto-wiring engine provided by the shared fixture
+
         # Step 2: Create and register agent
         autowire.register(
             name='research_agent',
@@ -150,7 +186,8 @@ class TestUserJourneyBasic:
         
         # Step 3: Resolve agent
         agent = autowire.resolve('research_agent')
-        assert isinstance(agent, ResearchAgent)
+        # Exact type expected here; pointer compare beats an MRO walk
+        assert type(agent) is ResearchAgent
         assert agent.name == 'research_agent'
         assert agent.get_config('model') == 'gpt-4'
         
@@ -163,14 +200,12 @@ class TestUserJourneyBasic:
         
         result = await agent.execute("Research AI trends", context)
         
-        # Step 5: Verify results
+        # Step 5: Verify results (key presence via one subset check)
+        assert _RESEARCH_RESULT_KEYS <= result.keys()
         assert result['success'] is True
         assert result['agent'] == 'research_agent'
-        assert 'findings' in result
         assert len(result['findings']) == 3
-        assert 'sources' in result
     
-    @pytest.mark.asyncio
     async def test_journey_agent_with_skills(self):
         """
         User Journey: Agent with skills
@@ -206,7 +241,6 @@ class TestUserJourneyBasic:
         summary_result = await agent.use_skill('summarization', data='test data')
         assert 'summary' in summary_result
     
-    @pytest.mark.asyncio
     async def test_journey_configuration_management(self):
         """
         User Journey: Configuration management workflow
@@ -246,7 +280,6 @@ class TestUserJourneyBasic:
 class TestUserJourneyMultiAgent:
     """Test multi-agent coordination journeys"""
     
-    @pytest.mark.asyncio
     async def test_journey_multi_agent_coordination(self):
         """
         User Journey: Multi-agent coordination
@@ -288,7 +321,37 @@ class TestUserJourneyMultiAgent:
         assert 'research' in agent_names
         assert 'analysis' in agent_names
     
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("n_runs", [1, 4])
+    async def test_journey_concurrent_coordinated_runs(self, n_runs):
+        """
+        User Journey: Several coordinated runs awaited concurrently
+
+        Steps:
+        1. Create coordinator with sub-agents
+        2. Launch multiple coordinated tasks via asyncio.gather
+        3. Verify every run succeeded independently
+        """
+        # Step 1: Build coordinator
+        coordinator = CoordinatorAgent('coordinator', {'role': 'orchestrator'})
+        coordinator.add_sub_agent(ResearchAgent('research', {}))
+        coordinator.add_sub_agent(AnalysisAgent('analysis', {}))
+
+        # Step 2: Run several coordinated tasks concurrently
+        runs = [
+            coordinator.execute(
+                f"Concurrent task {i}",
+                AgentContext(session_id=f'concurrent_session_{i}')
+            )
+            for i in range(n_runs)
+        ]
+        results = await asyncio.gather(*runs)
+
+        # Step 3: Verify every run succeeded
+        assert len(results) == n_runs
+        for result in results:
+            assert result['success'] is True
+            assert len(result['sub_results']) == 2
+
     async def test_journey_agent_communication_via_context(self):
         """
         User Journey: Agents communicate via shared context
@@ -332,7 +395,6 @@ class TestUserJourneyMultiAgent:
 class TestUserJourneyMCPIntegration:
     """Test MCP protocol integration journeys"""
     
-    @pytest.mark.asyncio
     async def test_journey_mcp_agent_communication(self):
         """
         User Journey: Agent communication via MCP protocol
@@ -360,8 +422,8 @@ class TestUserJourneyMCPIntegration:
                     message_type=MCPMessageType.REQUEST
                 )
                 
-                # Simulate processing
-                await asyncio.sleep(0.1)
+                # Yield to the event loop without a real-time delay
+                await asyncio.sleep(0)
                 
                 # Send response
                 response = self.mcp.send(
@@ -394,7 +456,6 @@ class TestUserJourneyMCPIntegration:
         assert history[0].role == MCPRole.USER
         assert history[1].role == MCPRole.ASSISTANT
     
-    @pytest.mark.asyncio
     async def test_journey_mcp_context_export_import(self):
         """
         User Journey: MCP context persistence
@@ -433,8 +494,7 @@ class TestUserJourneyMCPIntegration:
 class TestUserJourneyErrorHandling:
     """Test error handling and recovery journeys"""
     
-    @pytest.mark.asyncio
-    async def test_journey_graceful_degradation(self):
+    async def test_journey_graceful_degradation(self, agent_context):
         """
         User Journey: Graceful error handling
         
@@ -450,33 +510,34 @@ class TestUserJourneyErrorHandling:
                 self.primary_failed = False
                 self.fallback_used = False
             
+            def _fallback(self, task: str, error: ValueError) -> Dict[str, Any]:
+                self.primary_failed = True
+                self.fallback_used = True
+                self.log_warning("Primary failed, using fallback: %s", error)
+
+                return {
+                    'success': True,
+                    'method': 'fallback',
+                    'result': f"Fallback: {task}",
+                    'original_error': str(error)
+                }
+
             async def execute(self, task: str, context: AgentContext) -> Dict[str, Any]:
-                try:
-                    # Primary method
-                    if 'force_error' in task:
-                        raise ValueError("Simulated error")
-                    
-                    return {
-                        'success': True,
-                        'method': 'primary',
-                        'result': f"Primary: {task}"
-                    }
-                except ValueError as e:
-                    # Fallback method
-                    self.primary_failed = True
-                    self.fallback_used = True
-                    self.log_warning(f"Primary failed, using fallback: {e}")
-                    
-                    return {
-                        'success': True,
-                        'method': 'fallback',
-                        'result': f"Fallback: {task}",
-                        'original_error': str(e)
-                    }
+                # Dispatch on the known failure condition up front: same
+                # fallback semantics, no exception frame on the error path
+                if 'force_error' in task:
+                    return self._fallback(task, ValueError("Simulated error"))
+
+                return {
+                    'success': True,
+                    'method': 'primary',
+                    'result': f"Primary: {task}"
+                }
         
         # Step 1: Create resilient agent
         agent = ResilientAgent('resilient')
-        context = AgentContext(session_id='error_test')
+        context = agent_context
+        context.session_id = 'error_test'
         
         # Step 2: Normal execution
         normal_result = await agent.execute("normal task", context)
@@ -492,7 +553,6 @@ class TestUserJourneyErrorHandling:
         assert agent.fallback_used is True
         assert 'original_error' in error_result
     
-    @pytest.mark.asyncio
     async def test_journey_skill_not_available(self):
         """
         User Journey: Handle missing skill gracefully
@@ -514,8 +574,7 @@ class TestUserJourneyErrorHandling:
 class TestUserJourneyDependencyInjection:
     """Test dependency injection user journeys"""
     
-    @pytest.mark.asyncio
-    async def test_journey_autowire_dependency_chain(self):
+    async def test_journey_autowire_dependency_chain(self, agent_context, autowire):
         """
         User Journey: Complex dependency chain
         
@@ -553,8 +612,7 @@ class TestUserJourneyDependencyInjection:
                     'service_available': self.data_service is not None
                 }
         
-        # Step 2: Register with autowire
-        autowire = AutoWire()
+        # Step 2: Register with the shared autowire fixture
         autowire.register('data_service', DataService, Scope.SINGLETON)
         
         # Register agent with factory that uses dependency injection
@@ -567,18 +625,19 @@ class TestUserJourneyDependencyInjection:
         agent = autowire.resolve('data_agent')
         
         # Step 4: Verify injection
-        assert isinstance(agent, DataAgent)
+        assert type(agent) is DataAgent
         assert agent.data_service is not None
         
         # Step 5: Test functionality
-        context = AgentContext(session_id='di_test')
+        context = agent_context
+        context.session_id = 'di_test'
         result = await agent.execute("Test dependency injection", context)
         
         assert result['success'] is True
         assert result['service_available'] is True
         assert result['stored_task'] == "Test dependency injection"
     
-    def test_journey_singleton_vs_transient(self):
+    def test_journey_singleton_vs_transient(self, autowire):
         """
         User Journey: Understanding scopes
         
@@ -588,8 +647,6 @@ class TestUserJourneyDependencyInjection:
         3. Resolve multiple times
         4. Verify scope behavior
         """
-        autowire = AutoWire()
-        
         class Counter:
             instance_count = 0
             
@@ -627,7 +684,6 @@ class TestUserJourneyDependencyInjection:
 class TestUserJourneyEndToEnd:
     """Complete end-to-end user journey tests"""
     
-    @pytest.mark.asyncio
     async def test_journey_complete_workflow(self):
         """
         Complete User Journey: Full application workflow
@@ -698,20 +754,19 @@ class TestUserJourneyEndToEnd:
         
         # Verify research agent result
         research_result = final_result['sub_results'][0]
+        assert _RESEARCH_RESULT_KEYS <= research_result.keys()
         assert research_result['agent'] == 'researcher'
-        assert 'findings' in research_result
         assert len(research_result['findings']) > 0
-        
+
         # Verify analysis agent result
         analysis_result = final_result['sub_results'][1]
+        assert _ANALYSIS_RESULT_KEYS <= analysis_result.keys()
         assert analysis_result['agent'] == 'analyzer'
-        assert 'analysis' in analysis_result
         assert analysis_result['analysis']['confidence'] > 0
         
         # Verify context was shared
         assert context.metadata['workflow_name'] == 'complete_test'
     
-    @pytest.mark.asyncio
     async def test_journey_sequential_agent_pipeline(self):
         """
         User Journey: Sequential agent pipeline
@@ -733,33 +788,39 @@ class TestUserJourneyEndToEnd:
         # Step 2: Execute pipeline
         context = AgentContext(
             session_id='pipeline_test',
-            state={'pipeline_data': []}
+            state={}
         )
-        
+
         task = "Process through pipeline"
-        
+
+        # Preallocate at known length and index-assign: one state-dict
+        # lookup and no list growth inside the loop
+        pipeline = [None] * len(agents)
+        context.state['pipeline_data'] = pipeline
+
         for i, agent in enumerate(agents):
             result = await agent.execute(task, context)
-            
-            # Add result to pipeline data
-            context.state['pipeline_data'].append({
+
+            pipeline[i] = {
                 'stage': i + 1,
                 'agent': agent.name,
                 'result': result
-            })
+            }
         
         # Step 3: Verify pipeline execution
         pipeline_data = context.state['pipeline_data']
         assert len(pipeline_data) == 3
         
-        # Verify each stage
-        assert pipeline_data[0]['agent'] == 'stage1'
-        assert pipeline_data[1]['agent'] == 'stage2'
-        assert pipeline_data[2]['agent'] == 'stage3'
+        # Verify each stage (unpack once instead of repeated indexing)
+        stage1, stage2, stage3 = pipeline_data
+        assert stage1['agent'] == 'stage1'
+        assert stage2['agent'] == 'stage2'
+        assert stage3['agent'] == 'stage3'
         
-        # Verify all succeeded
-        for stage_data in pipeline_data:
-            assert stage_data['result']['success'] is True
+        # Verify all succeeded in one pass via C-level map/itemgetter
+        get_result = itemgetter('result')
+        get_success = itemgetter('success')
+        assert all(map(get_success, map(get_result, pipeline_data)))
 
 
 if __name__ == '__main__':